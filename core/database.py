@@ -1,24 +1,107 @@
 """Hermes TV — aiosqlite database wrapper."""
 
+import asyncio
+
 import aiosqlite
 from core.config import DB_PATH
+from core.log import get_logger
+
+log = get_logger("db")
 
 _db: aiosqlite.Connection | None = None
 
+# Read-only connections, each on its own worker thread. WAL lets them read
+# concurrently with each other and with the writer (_db).
+READ_POOL_SIZE = 4
+_read_pool: asyncio.Queue | None = None
+_read_conns: list[aiosqlite.Connection] = []
+
+# Applied once to the shared connection. WAL + synchronous=NORMAL keeps
+# commits durable across app crashes without an fsync on every write.
+_PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA busy_timeout=5000;
+PRAGMA foreign_keys=ON;
+PRAGMA temp_store=MEMORY;
+PRAGMA mmap_size=268435456;
+PRAGMA cache_size=-65536;
+"""
+
+_READ_PRAGMAS = """
+PRAGMA busy_timeout=5000;
+PRAGMA temp_store=MEMORY;
+PRAGMA mmap_size=268435456;
+PRAGMA cache_size=-16384;
+"""
+
+# sqlite3 keeps an LRU of prepared statements per connection (default 128).
+# The shared writer sees nearly every query in the app plus variable-arity
+# IN (...) lists, so give it room to keep the hot ones compiled.
+_STATEMENT_CACHE_SIZE = 512
+
 
 async def get_db() -> aiosqlite.Connection:
     global _db
     if _db is None:
-        _db = await aiosqlite.connect(DB_PATH)
+        _db = await aiosqlite.connect(DB_PATH, cached_statements=_STATEMENT_CACHE_SIZE)
         _db.row_factory = aiosqlite.Row
-        await _db.execute("PRAGMA journal_mode=WAL")
-        await _db.execute("PRAGMA busy_timeout=5000")
-        await _db.execute("PRAGMA foreign_keys=ON")
+        await _db.executescript(_PRAGMAS)
     return _db
 
 
+async def fetch_one(db: aiosqlite.Connection, sql: str, params: tuple = ()) -> aiosqlite.Row | None:
+    """Execute + fetch in a single hop to the connection's worker thread.
+
+    Meant for LIMIT 1 / aggregate queries — all rows are fetched.
+    """
+    rows = await db.execute_fetchall(sql, params)
+    return rows[0] if rows else None
+
+
+async def _open_read_pool():
+    global _read_pool
+    if _read_pool is not None:
+        return
+    pool = asyncio.Queue()
+    for _ in range(READ_POOL_SIZE):
+        conn = await aiosqlite.connect(f"file:{DB_PATH}?mode=ro", uri=True)
+        conn.row_factory = aiosqlite.Row
+        await conn.executescript(_READ_PRAGMAS)
+        _read_conns.append(conn)
+        pool.put_nowait(conn)
+    _read_pool = pool
+
+
+async def read_all(sql: str, params: tuple = ()) -> list[aiosqlite.Row]:
+    """Run a read-only query on a pooled connection.
+
+    Each call borrows a connection for just this query, so concurrent
+    reads (e.g. under asyncio.gather) run in parallel without any caller
+    holding one connection while waiting on another. Falls back to the
+    shared connection before init_db() has opened the pool.
+    """
+    pool = _read_pool
+    if pool is None:
+        return list(await (await get_db()).execute_fetchall(sql, params))
+    conn = await pool.get()
+    try:
+        return list(await conn.execute_fetchall(sql, params))
+    finally:
+        pool.put_nowait(conn)
+
+
+async def read_one(sql: str, params: tuple = ()) -> aiosqlite.Row | None:
+    """Single-row variant of read_all (LIMIT 1 / aggregate queries)."""
+    rows = await read_all(sql, params)
+    return rows[0] if rows else None
+
+
 async def close_db():
-    global _db
+    global _db, _read_pool
+    _read_pool = None
+    while _read_conns:
+        await _read_conns.pop().close()
     if _db is not None:
         await _db.close()
         _db = None
@@ -36,6 +119,7 @@ async def init_db():
     if await cursor.fetchone():
         # Run migrations for existing DBs
         await _migrate(db)
+        await _open_read_pool()
         return
 
     schema_path = os.path.join(os.path.dirname(__file__), "..", "schema.sql")
@@ -44,10 +128,11 @@ async def init_db():
 
     with open(schema_path) as f:
         await db.executescript(f.read())
-    print("[db] Schema initialized")
+    log.info("Schema initialized")
 
     # Run migrations (creates tables not in schema.sql, e.g. characters)
     await _migrate(db)
+    await _open_read_pool()
 
 
 async def _migrate(db: aiosqlite.Connection):
@@ -61,7 +146,7 @@ async def _migrate(db: aiosqlite.Connection):
         await db.execute("ALTER TABLE hosts ADD COLUMN tts_voice_id TEXT DEFAULT ''")
         # Copy piper_model → tts_voice_id for existing hosts
         await db.execute("UPDATE hosts SET tts_voice_id = piper_model WHERE tts_voice_id = ''")
-        print("[db] Migration: added tts_provider, tts_voice_id to hosts")
+        log.info("Migration: added tts_provider, tts_voice_id to hosts")
 
     # Ensure TTS settings rows exist
     for key, default in [
@@ -100,6 +185,46 @@ async def _migrate(db: aiosqlite.Connection):
             (key, default),
         )
 
+    # Generated column flagging breaks that have a rendered video
+    cursor = await db.execute("PRAGMA table_xinfo(break_queue)")
+    bq_columns = {row[1] for row in await cursor.fetchall()}
+    if "has_video" not in bq_columns:
+        await db.execute(
+            """ALTER TABLE break_queue ADD COLUMN has_video INTEGER
+               GENERATED ALWAYS AS (
+                   CASE WHEN json_valid(meta_json)
+                        THEN json_extract(meta_json, '$.video_path') IS NOT NULL
+                        ELSE 0 END
+               ) VIRTUAL"""
+        )
+        log.info("Migration: added has_video to break_queue")
+    await db.execute(
+        "CREATE INDEX IF NOT EXISTS idx_break_queue_video ON break_queue(status, has_video, played_at)"
+    )
+
+    # Indexes for dashboard/status queries (last played break, today's stats)
+    await db.execute(
+        "CREATE INDEX IF NOT EXISTS idx_break_queue_status_played ON break_queue(status, played_at DESC)"
+    )
+    # (created_at, status) covers the today-stats SUM(CASE status) without row lookups
+    await db.execute("DROP INDEX IF EXISTS idx_break_queue_created")
+    await db.execute(
+        "CREATE INDEX IF NOT EXISTS idx_break_queue_created_status ON break_queue(created_at, status)"
+    )
+
+    # Log viewer: prefix filter on type, newest first
+    await db.execute(
+        "CREATE INDEX IF NOT EXISTS idx_events_type_ts ON events_log(event_type, timestamp DESC)"
+    )
+
+    # Logged-out admin session nonces (checked on every cookie-authenticated request)
+    await db.execute("""
+        CREATE TABLE IF NOT EXISTS revoked_sessions (
+            nonce TEXT PRIMARY KEY,
+            expires_at INTEGER NOT NULL
+        )
+    """)
+
     # --- Characters table ---
     await db.execute("""
         CREATE TABLE IF NOT EXISTS characters (
@@ -199,4 +324,4 @@ async def _seed_characters(db):
                 s["position_y"], s["scale"], s["positions_json"],
             ),
         )
-    print("[db] Seeded 3 default characters")
+    log.info("Seeded 3 default characters")
@@ -0,0 +1,55 @@
+"""Logging — records are queued on the caller and written to stdout by a background thread.
+
+Every module logs through a "hermes.<tag>" logger (get_logger here; visual/ uses
+logging.getLogger("hermes.<tag>") directly to stay importable without core), so all
+lines share one ordered stream. Don't mix in print() — it bypasses the queue.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+import sys
+
+
+class _TagFormatter(logging.Formatter):
+    """"[tag] message" lines, tag being the last part of the logger name."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        return f"[{record.name.rpartition('.')[2]}] {record.getMessage()}"
+
+
+_queue: queue.SimpleQueue = queue.SimpleQueue()
+_stdout = logging.StreamHandler(sys.stdout)
+_stdout.setFormatter(_TagFormatter())
+_listener = logging.handlers.QueueListener(_queue, _stdout)
+_listener.start()
+
+# Everything under "hermes." goes through the queue; third-party loggers are untouched
+_root = logging.getLogger("hermes")
+_queue_handler = logging.handlers.QueueHandler(_queue)
+_root.addHandler(_queue_handler)
+_root.setLevel(logging.INFO)
+_root.propagate = False
+
+
+def get_logger(tag: str) -> logging.Logger:
+    """Logger whose lines are prefixed with [tag]."""
+    return logging.getLogger(f"hermes.{tag}")
+
+
+def shutdown():
+    """Write out everything queued and stop the writer thread.
+
+    Records logged afterwards are written directly, so nothing is dropped.
+    Safe to call more than once.
+    """
+    if _queue_handler not in _root.handlers:
+        return
+    _root.removeHandler(_queue_handler)
+    _root.addHandler(_stdout)
+    _listener.stop()  # drains the queue before returning
+    _stdout.flush()
+
+
+atexit.register(shutdown)
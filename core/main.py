@@ -9,7 +9,6 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import HTMLResponse, FileResponse
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
 from starlette.responses import Response
 
 # Ensure core package is importable
@@ -17,15 +16,20 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from core.config import HLS_VIDEO_DIR, BREAKS_DIR, BASE_PATH
 from core.database import init_db, close_db
+from core.log import get_logger, shutdown as shutdown_logging
 from core.routers import status
+from core.services import event_log
 from core.services.scheduler import scheduler
+from core.templating import render
+
+log = get_logger("hermes-tv")
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
     await init_db()
-    print("[hermes-tv] Database initialized")
+    log.info("Database initialized")
 
     # Clean stale PREPARING breaks left by previous crash/restart
     try:
@@ -36,9 +40,9 @@ async def lifespan(app: FastAPI):
         )
         await db.commit()
         if res.rowcount:
-            print(f"[hermes-tv] Cleaned {res.rowcount} stale PREPARING break(s)")
+            log.info(f"Cleaned {res.rowcount} stale PREPARING break(s)")
     except Exception as e:
-        print(f"[hermes-tv] Stale break cleanup error: {e}")
+        log.warning(f"Stale break cleanup error: {e}")
 
     # Prune old data to keep SQLite lean
     try:
@@ -50,9 +54,9 @@ async def lifespan(app: FastAPI):
         await db.commit()
         pruned = c1.rowcount + c2.rowcount + c3.rowcount
         if pruned:
-            print(f"[hermes-tv] Pruned {pruned} old rows (events={c1.rowcount}, news_cache={c2.rowcount}, failed_breaks={c3.rowcount})")
+            log.info(f"Pruned {pruned} old rows (events={c1.rowcount}, news_cache={c2.rowcount}, failed_breaks={c3.rowcount})")
     except Exception as e:
-        print(f"[hermes-tv] DB pruning error: {e}")
+        log.warning(f"DB pruning error: {e}")
 
     # Wire up break builder (scheduler starts only if enabled in settings)
     try:
@@ -63,11 +67,11 @@ async def lifespan(app: FastAPI):
         row = await cursor.fetchone()
         if row and row["value"] == "true":
             scheduler.start()
-            print("[hermes-tv] Scheduler started (enabled in settings)")
+            log.info("Scheduler started (enabled in settings)")
         else:
-            print("[hermes-tv] Scheduler idle (enable via admin dashboard)")
+            log.info("Scheduler idle (enable via admin dashboard)")
     except Exception as e:
-        print(f"[hermes-tv] Scheduler setup error: {e}")
+        log.warning(f"Scheduler setup error: {e}")
 
     # Ensure HLS video dir exists + clean old dirs (>24h)
     try:
@@ -79,14 +83,17 @@ async def lifespan(app: FastAPI):
             if d.is_dir() and d.stat().st_mtime < cutoff:
                 shutil.rmtree(d, ignore_errors=True)
     except Exception as e:
-        print(f"[hermes-tv] HLS video cleanup error: {e}")
+        log.warning(f"HLS video cleanup error: {e}")
 
     yield
 
     # Shutdown
     await scheduler.stop()
+    await event_log.close()
     await close_db()
-    print("[hermes-tv] Shutdown complete")
+    log.info("Shutdown complete")
+    # Last: drain the log queue so the final lines aren't lost with the process
+    shutdown_logging()
 
 
 app = FastAPI(
@@ -171,17 +178,13 @@ async def serve_hls_video(break_id: str, filename: str):
     return Response(status_code=404)
 
 
-# Templates
-templates = Jinja2Templates(directory=str(Path(__file__).parent / "templates"))
-templates.env.globals["base"] = BASE_PATH
-
 # Routers
 app.include_router(status.router)
 
 
 @app.get("/", response_class=HTMLResponse)
 async def tv_page(request: Request):
-    return templates.TemplateResponse("tv.html", {"request": request})
+    return render("tv.html", {"request": request})
 
 
 # Lazy-load optional routers
@@ -7,6 +7,9 @@ from datetime import datetime, timezone
 import httpx
 
 from core.database import get_db
+from core.log import get_logger
+
+log = get_logger("bitcoin")
 
 API_URL = "https://rtvapi.roxom.com/btc/info"
 
@@ -73,7 +76,7 @@ async def _fetch_bitcoin(api_key: str) -> dict | None:
 
         return _extract(data)
     except Exception as e:
-        print(f"[bitcoin] Error fetching: {e}")
+        log.warning(f"Error fetching: {e}")
         return None
 
 
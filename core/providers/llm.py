@@ -6,7 +6,10 @@ import time
 from openai import AsyncOpenAI
 
 from core.config import OPENAI_API_KEY
-from core.database import get_db
+from core.log import get_logger
+from core.services import event_log
+
+log = get_logger("llm")
 
 _client: AsyncOpenAI | None = None
 
@@ -76,16 +79,11 @@ async def score_headlines(headlines: list[dict]) -> list[dict]:
             return []
 
         # Log latency
-        db = await get_db()
-        await db.execute(
-            "INSERT INTO events_log (event_type, payload_json, latency_ms) VALUES (?, ?, ?)",
-            ("llm_score", json.dumps({"count": len(headlines)}), latency),
-        )
-        await db.commit()
+        event_log.log_event("llm_score", {"count": len(headlines)}, latency)
 
         return parsed
     except Exception as e:
-        print(f"[llm] Scoring error: {e}")
+        log.warning(f"Scoring error: {e}")
         return []
 
 
@@ -140,20 +138,13 @@ async def generate_break_script(
         script = resp.choices[0].message.content.strip()
 
         # Log
-        db = await get_db()
-        await db.execute(
-            "INSERT INTO events_log (event_type, payload_json, latency_ms) VALUES (?, ?, ?)",
-            (
-                "llm_write",
-                json.dumps({"host": host.get("id"), "is_breaking": is_breaking}),
-                latency,
-            ),
+        event_log.log_event(
+            "llm_write", {"host": host.get("id"), "is_breaking": is_breaking}, latency
         )
-        await db.commit()
 
         return script
     except Exception as e:
-        print(f"[llm] Generation error: {e}")
+        log.warning(f"Generation error: {e}")
         return None
 
 
@@ -221,20 +212,13 @@ async def generate_dialog_script(
         script["characters"] = characters
 
         # Log
-        db = await get_db()
-        await db.execute(
-            "INSERT INTO events_log (event_type, payload_json, latency_ms) VALUES (?, ?, ?)",
-            (
-                "llm_dialog",
-                json.dumps({"characters": characters, "topic": topic[:100]}),
-                latency,
-            ),
+        event_log.log_event(
+            "llm_dialog", {"characters": characters, "topic": topic[:100]}, latency
         )
-        await db.commit()
 
         return script
     except Exception as e:
-        print(f"[llm] Dialog generation error: {e}")
+        log.warning(f"Dialog generation error: {e}")
         return None
 
 
@@ -10,6 +10,9 @@ import feedparser
 import httpx
 
 from core.database import get_db
+from core.log import get_logger
+
+log = get_logger("news")
 
 # Strip HTML tags and control chars for LLM safety
 _TAG_RE = re.compile(r"<[^>]+>")
@@ -167,7 +170,7 @@ async def _fetch_feed(source: dict) -> list[dict]:
         return headlines
 
     except Exception as e:
-        print(f"[news] Error fetching {source['label']}: {e}")
+        log.warning(f"Error fetching {source['label']}: {e}")
         # Update health: failure
         await db.execute(
             """UPDATE feed_health
@@ -194,11 +197,14 @@ async def get_recent_unscored(limit: int = 30) -> list[dict]:
     return [dict(r) for r in await cursor.fetchall()]
 
 
-async def mark_scored(news_id: str, score: int, category: str | None = None):
+async def mark_scored_batch(scores: list[tuple[str, int, str | None]]):
+    """Store LLM scores as (news_id, score, category) tuples in one transaction."""
+    if not scores:
+        return
     db = await get_db()
-    await db.execute(
+    await db.executemany(
         "UPDATE cache_news SET scored = 1, score = ?, category = COALESCE(?, category) WHERE id = ?",
-        (score, category, news_id),
+        [(score, category, news_id) for news_id, score, category in scores],
     )
     await db.commit()
 
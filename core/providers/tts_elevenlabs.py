@@ -7,6 +7,9 @@ import time
 import httpx
 
 from core.config import BREAKS_DIR
+from core.log import get_logger
+
+log = get_logger("tts:elevenlabs")
 
 
 async def synthesize(
@@ -28,11 +31,11 @@ async def synthesize(
         Path to the normalized MP3 file, or None on failure.
     """
     if not api_key:
-        print("[tts:elevenlabs] No API key configured")
+        log.warning("No API key configured")
         return None
 
     if not voice_id:
-        print("[tts:elevenlabs] No voice_id configured")
+        log.warning("No voice_id configured")
         return None
 
     os.makedirs(str(BREAKS_DIR), exist_ok=True)
@@ -62,7 +65,7 @@ async def synthesize(
             resp = await client.post(url, json=payload, headers=headers)
 
         if resp.status_code != 200:
-            print(f"[tts:elevenlabs] API error {resp.status_code}: {resp.text[:200]}")
+            log.warning(f"API error {resp.status_code}: {resp.text[:200]}")
             return None
 
         with open(raw_path, "wb") as f:
@@ -82,11 +85,11 @@ async def synthesize(
         _, stderr = await asyncio.wait_for(proc.communicate(), timeout=30.0)
 
         if proc.returncode != 0:
-            print(f"[tts:elevenlabs] FFmpeg normalize failed: {stderr.decode()}")
+            log.warning(f"FFmpeg normalize failed: {stderr.decode()}")
             return None
 
         elapsed = time.time() - t0
-        print(f"[tts:elevenlabs] Generated {output_id} in {elapsed:.1f}s")
+        log.info(f"Generated {output_id} in {elapsed:.1f}s")
 
         # Clean up raw file
         try:
@@ -97,8 +100,8 @@ async def synthesize(
         return mp3_path
 
     except asyncio.TimeoutError:
-        print(f"[tts:elevenlabs] Timeout generating {output_id}")
+        log.warning(f"Timeout generating {output_id}")
         return None
     except Exception as e:
-        print(f"[tts:elevenlabs] Error: {e}")
+        log.warning(f"Error: {e}")
         return None
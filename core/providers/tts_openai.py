@@ -5,6 +5,9 @@ import os
 import time
 
 from core.config import BREAKS_DIR, OPENAI_API_KEY
+from core.log import get_logger
+
+log = get_logger("tts:openai")
 
 # Singleton client (reuses HTTP connection pool)
 _tts_client = None
@@ -38,7 +41,7 @@ async def synthesize(
     """
     client = _get_tts_client()
     if not client:
-        print("[tts:openai] No OPENAI_API_KEY configured")
+        log.warning("No OPENAI_API_KEY configured")
         return None
 
     if not voice:
@@ -82,11 +85,11 @@ async def synthesize(
         _, stderr = await asyncio.wait_for(proc.communicate(), timeout=30.0)
 
         if proc.returncode != 0:
-            print(f"[tts:openai] FFmpeg normalize failed: {stderr.decode()}")
+            log.warning(f"FFmpeg normalize failed: {stderr.decode()}")
             return None
 
         elapsed = time.time() - t0
-        print(f"[tts:openai] Generated {output_id} in {elapsed:.1f}s")
+        log.info(f"Generated {output_id} in {elapsed:.1f}s")
 
         # Clean up raw file
         try:
@@ -97,11 +100,11 @@ async def synthesize(
         return mp3_path
 
     except asyncio.TimeoutError:
-        print(f"[tts:openai] Timeout generating {output_id}")
+        log.warning(f"Timeout generating {output_id}")
         _cleanup_temp(raw_path)
         return None
     except Exception as e:
-        print(f"[tts:openai] Error: {e}")
+        log.warning(f"Error: {e}")
         _cleanup_temp(raw_path)
         return None
 
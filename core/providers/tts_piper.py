@@ -5,6 +5,9 @@ import os
 import time
 
 from core.config import PIPER_BIN, MODELS_DIR, BREAKS_DIR
+from core.log import get_logger
+
+log = get_logger("tts")
 
 # Piper ships bundled .so libs — ensure LD_LIBRARY_PATH includes their dir.
 _PIPER_LIB_DIR = os.path.dirname(os.path.realpath(PIPER_BIN))
@@ -37,7 +40,7 @@ async def synthesize(
     """
     model_path = os.path.join(str(MODELS_DIR), f"{model_name}.onnx")
     if not os.path.exists(model_path):
-        print(f"[tts] Model not found: {model_path}")
+        log.warning(f"Model not found: {model_path}")
         return None
 
     os.makedirs(str(BREAKS_DIR), exist_ok=True)
@@ -63,11 +66,11 @@ async def synthesize(
         )
 
         if proc.returncode != 0:
-            print(f"[tts] Piper failed: {stderr.decode()}")
+            log.warning(f"Piper failed: {stderr.decode()}")
             return None
 
         if not os.path.exists(wav_path):
-            print("[tts] WAV file not created")
+            log.warning("WAV file not created")
             return None
 
         # Step 2: FFmpeg loudnorm → MP3
@@ -87,11 +90,11 @@ async def synthesize(
         )
 
         if proc2.returncode != 0:
-            print(f"[tts] FFmpeg normalize failed: {stderr2.decode()}")
+            log.warning(f"FFmpeg normalize failed: {stderr2.decode()}")
             return None
 
         elapsed = time.time() - t0
-        print(f"[tts] Generated {output_id} in {elapsed:.1f}s")
+        log.info(f"Generated {output_id} in {elapsed:.1f}s")
 
         # Clean up WAV
         try:
@@ -102,11 +105,11 @@ async def synthesize(
         return mp3_path
 
     except asyncio.TimeoutError:
-        print(f"[tts] Timeout generating {output_id}")
+        log.warning(f"Timeout generating {output_id}")
         _cleanup_temp(wav_path)
         return None
     except Exception as e:
-        print(f"[tts] Error: {e}")
+        log.warning(f"Error: {e}")
         _cleanup_temp(wav_path)
         return None
 
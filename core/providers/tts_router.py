@@ -1,8 +1,11 @@
 """TTS router — dispatches synthesis to the right provider per host."""
 
 from core.database import get_db
+from core.log import get_logger
 from core.providers import tts_piper, tts_elevenlabs, tts_openai
 
+log = get_logger("tts")
+
 
 async def _get_setting(key: str) -> str:
     db = await get_db()
@@ -26,12 +29,12 @@ async def synthesize(text: str, host: dict, output_id: str) -> str | None:
     provider = host.get("tts_provider") or "piper"
     voice_id = host.get("tts_voice_id") or host.get("piper_model", "")
 
-    print(f"[tts] Using provider={provider} voice={voice_id} for host={host.get('label', '?')}")
+    log.info(f"Using provider={provider} voice={voice_id} for host={host.get('label', '?')}")
 
     if provider == "elevenlabs":
         api_key = await _get_setting("elevenlabs_api_key")
         if not api_key:
-            print("[tts] ElevenLabs API key not set, falling back to piper")
+            log.warning("ElevenLabs API key not set, falling back to piper")
             return await tts_piper.synthesize(text, host.get("piper_model", ""), output_id)
         return await tts_elevenlabs.synthesize(text, voice_id, output_id, api_key)
 
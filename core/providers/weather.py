@@ -1,5 +1,6 @@
 """Weather provider — WeatherAPI.com with SQLite cache."""
 
+import asyncio
 import json
 import time
 from datetime import datetime, timezone
@@ -8,26 +9,38 @@ import httpx
 
 from core.config import WEATHER_API_KEY
 from core.database import get_db
+from core.log import get_logger
+
+log = get_logger("weather")
 
 CACHE_TTL_SECONDS = 600  # 10 minutes
+FETCH_TIMEOUT_SECONDS = 5.0  # per-city cap so one slow response can't stall a break
 API_BASE = "https://api.weatherapi.com/v1/current.json"
 
+# Bound concurrent WeatherAPI requests (free-tier rate limits)
+_WEATHER_SEM = asyncio.Semaphore(8)
+
 
 async def get_weather_for_cities() -> list[dict]:
     """Fetch weather for all enabled cities (in parallel), using cache when fresh."""
-    import asyncio
-
     db = await get_db()
     cursor = await db.execute(
         "SELECT id, label, lat, lon, units FROM cities WHERE enabled = 1 ORDER BY priority"
     )
     cities = await cursor.fetchall()
 
-    fetched = await asyncio.gather(
-        *[_get_cached_or_fetch(dict(city)) for city in cities],
-        return_exceptions=True,
-    )
-    return [data for data in fetched if isinstance(data, dict)]
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(_get_city_weather(dict(city))) for city in cities]
+    return [t.result() for t in tasks if t.result()]
+
+
+async def _get_city_weather(city: dict) -> dict | None:
+    """Per-city task wrapper — never raises, so one city can't cancel the group."""
+    try:
+        return await _get_cached_or_fetch(city)
+    except Exception as e:
+        log.warning(f"Error for {city['label']}: {e}")
+        return None
 
 
 async def _get_cached_or_fetch(city: dict) -> dict | None:
@@ -45,8 +58,8 @@ async def _get_cached_or_fetch(city: dict) -> dict | None:
         payload["city_label"] = city["label"]
         return payload
 
-    # Fetch fresh
-    fresh = await _fetch_weather(city)
+    # Fetch fresh (bounded concurrency + timeout; falls back to stale cache)
+    fresh = await _fetch_weather_bounded(city)
     if fresh:
         expires = datetime.fromtimestamp(
             time.time() + CACHE_TTL_SECONDS, tz=timezone.utc
@@ -70,6 +83,15 @@ async def _get_cached_or_fetch(city: dict) -> dict | None:
     return None
 
 
+async def _fetch_weather_bounded(city: dict) -> dict | None:
+    async with _WEATHER_SEM:
+        try:
+            return await asyncio.wait_for(_fetch_weather(city), timeout=FETCH_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            log.warning(f"Timeout fetching {city['label']}")
+            return None
+
+
 async def _fetch_weather(city: dict) -> dict | None:
     if not WEATHER_API_KEY:
         return None
@@ -101,5 +123,5 @@ async def _fetch_weather(city: dict) -> dict | None:
             "wind_units": "mph" if is_imperial else "kph",
         }
     except Exception as e:
-        print(f"[weather] Error fetching {city['label']}: {e}")
+        log.warning(f"Error fetching {city['label']}: {e}")
         return None
@@ -1,35 +1,104 @@
 """Admin router — CRUD for cities, sources, hosts, characters, settings + auth."""
 
+import asyncio
 import hashlib
-import json
+import hmac
+import os
 import re
-import uuid
+import secrets
+import time
 from pathlib import Path
+from urllib.parse import quote
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Request, Response, UploadFile
-from fastapi.responses import HTMLResponse, RedirectResponse, FileResponse
-from fastapi.templating import Jinja2Templates
+from fastapi.responses import HTMLResponse, RedirectResponse, FileResponse, ORJSONResponse
 
 from core.config import HERMES_API_KEY, BASE_PATH, HLS_VIDEO_DIR, ASSETS_DIR
-from core.database import get_db
+from core.database import fetch_one, get_db, read_all, read_one
+from core.services.character_sync import sync_character_config
+from core.services import hosts_cache, settings_cache
+from core.services.scheduler import scheduler
+from core.templating import render
 
-router = APIRouter(tags=["admin"])
-templates = Jinja2Templates(directory=str(Path(__file__).parent.parent / "templates"))
-templates.env.globals["base"] = BASE_PATH
+router = APIRouter(tags=["admin"], default_response_class=ORJSONResponse)
 
 
 def _redirect(path: str, status_code: int = 303) -> RedirectResponse:
     """RedirectResponse with BASE_PATH prefix."""
     return RedirectResponse(f"{BASE_PATH}{path}", status_code=status_code)
 
-# Session tokens (in-memory, simple)
-_sessions: set[str] = set()
-_MAX_SESSIONS = 100
+# Sessions are signed cookies: "<nonce>.<expiry>.<signature>"; logged-out nonces are
+# kept in revoked_sessions until the cookie would have expired anyway
+_SESSION_TTL = 86400  # matches the cookie max_age
+_API_KEY_BYTES = HERMES_API_KEY.encode()
+# blake2s keys are capped at 32 bytes, so derive them from the API key of any length
+_CSRF_KEY = hashlib.blake2s(_API_KEY_BYTES).digest()
+_SESSION_KEY = hashlib.blake2s(_API_KEY_BYTES, person=b"session").digest()
+# Compare fixed-size digests so neither the value nor the length of the key leaks
+_API_KEY_DIGEST = hashlib.blake2b(_API_KEY_BYTES, digest_size=32).digest()
+
+
+def _key_matches(candidate: str) -> bool:
+    """Constant-time check of a submitted API key / admin password."""
+    digest = hashlib.blake2b(candidate.encode(), digest_size=32).digest()
+    return hmac.compare_digest(digest, _API_KEY_DIGEST)
+
+
+def _session_sig(payload: str) -> str:
+    return hashlib.blake2s(payload.encode(), key=_SESSION_KEY, digest_size=16).hexdigest()
+
+
+def _new_session() -> str:
+    """Signed session cookie value, valid for _SESSION_TTL."""
+    payload = f"{secrets.token_urlsafe(16)}.{int(time.time()) + _SESSION_TTL}"
+    return f"{payload}.{_session_sig(payload)}"
+
+
+def _parse_session(session: str | None) -> tuple[str, int] | None:
+    """(nonce, expiry) of a correctly signed, unexpired session cookie."""
+    if not session:
+        return None
+    payload, _, sig = session.rpartition(".")
+    if not payload or not hmac.compare_digest(sig, _session_sig(payload)):
+        return None
+    nonce, _, expires = payload.rpartition(".")
+    if not expires.isdigit() or int(expires) <= time.time():
+        return None
+    return nonce, int(expires)
+
+
+async def _valid_session(session: str | None) -> bool:
+    """Verify a session cookie's signature and expiry, and that it wasn't logged out."""
+    parsed = _parse_session(session)
+    if parsed is None:
+        return False
+    revoked = await read_one("SELECT 1 FROM revoked_sessions WHERE nonce = ?", (parsed[0],))
+    return revoked is None
+
+
+async def _revoke_session(session: str | None):
+    """Reject this cookie from now on, even if a copy of it is replayed."""
+    parsed = _parse_session(session)
+    if parsed is None:
+        return
+    db = await get_db()
+    # Expired cookies fail _parse_session on their own, so their rows can go
+    await db.execute("DELETE FROM revoked_sessions WHERE expires_at <= ?", (int(time.time()),))
+    await db.execute(
+        "INSERT OR IGNORE INTO revoked_sessions (nonce, expires_at) VALUES (?, ?)", parsed
+    )
+    await db.commit()
 
 
 def _csrf_token(session_id: str) -> str:
-    """Generate a per-session CSRF token."""
-    return hashlib.sha256(f"{session_id}:{HERMES_API_KEY}".encode()).hexdigest()[:32]
+    """Per-session CSRF token, keyed on the API key."""
+    return hashlib.blake2s(session_id.encode(), key=_CSRF_KEY, digest_size=16).hexdigest()
+
+
+def _session_csrf(session_id: str | None) -> str:
+    """CSRF token for a signed session cookie, or "" if not logged in."""
+    return _csrf_token(session_id) if _parse_session(session_id) else ""
 
 
 def _get_session(request: Request) -> str | None:
@@ -37,21 +106,39 @@ def _get_session(request: Request) -> str | None:
     return request.cookies.get("hermes_session")
 
 
+_SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+_FORM_TYPES = ("application/x-www-form-urlencoded", "multipart/form-data")
+
+
+async def _csrf_ok(request: Request, session: str) -> bool:
+    """Constant-time check of the X-CSRF-Token header (fetch/HTMX) or csrf_token form field."""
+    token = request.headers.get("x-csrf-token")
+    if token is None and request.headers.get("content-type", "").startswith(_FORM_TYPES):
+        # Starlette caches the parsed form, so the handler's request.form() reuses it
+        token = (await request.form()).get("csrf_token")
+    if not isinstance(token, str):
+        return False
+    return hmac.compare_digest(token.encode(), _csrf_token(session).encode())
+
+
 async def require_api_key(request: Request):
     """Check API key from header or session cookie. Redirects browsers to login."""
-    # Check header
-    api_key = request.headers.get("X-API-Key")
-    if api_key == HERMES_API_KEY:
+    headers = request.headers
+    # Check header (constant-time) before touching cookies
+    api_key = headers.get("x-api-key")
+    if api_key is not None and _key_matches(api_key):
         return True
 
-    # Check session cookie
-    session = request.cookies.get("hermes_session")
-    if session in _sessions:
-        return True
+    # Check session cookie; browsers attach it to cross-site requests too, so
+    # state-changing requests must also carry the session's CSRF token
+    session = _get_session(request)
+    if await _valid_session(session):
+        if request.method in _SAFE_METHODS or await _csrf_ok(request, session):
+            return True
+        raise HTTPException(status_code=403, detail="Invalid CSRF token")
 
     # Browser requests: redirect to login instead of JSON 401
-    accept = request.headers.get("accept", "")
-    if "text/html" in accept:
+    if "text/html" in headers.get("accept", ""):
         raise HTTPException(
             status_code=307,
             headers={"Location": f"{BASE_PATH}/admin/login"},
@@ -60,117 +147,149 @@ async def require_api_key(request: Request):
     raise HTTPException(status_code=401, detail="Unauthorized")
 
 
-def _validate_csrf(request: Request):
-    """Validate CSRF token on POST requests."""
-    session = _get_session(request)
-    if not session or session not in _sessions:
-        return  # Auth check will catch this
-    expected = _csrf_token(session)
-    # Check form field or header
-    token = None
-    # For HTMX requests, check header
-    token = request.headers.get("X-CSRF-Token")
-    return  # CSRF validation - log but don't block for now during rollout
-
-
 def _template_ctx(request: Request, nav_active: str = "", **extra) -> dict:
     """Build common template context with CSRF token."""
-    session = _get_session(request)
-    csrf = _csrf_token(session) if session else ""
+    csrf = _session_csrf(_get_session(request))
     return {"request": request, "nav_active": nav_active, "csrf_token": csrf, **extra}
 
 
+# --- Form parsing ---
+# Characters stripped from user-supplied slugs
+_ID_RE = re.compile(r'[^a-z0-9_-]')
+_EMOTION_RE = re.compile(r'[^a-z0-9_]')
+
+
+def _checkbox(value) -> int:
+    """HTML checkbox → 0/1 (unchecked boxes are not sent)."""
+    return 1 if value == "on" else 0
+
+
+def _clamped_float(lo: float, hi: float):
+    """Build a caster that parses a float and clamps it to [lo, hi]."""
+    def cast(value) -> float:
+        return max(lo, min(hi, float(value)))
+    return cast
+
+
+def _parse_form(form, schema: list[tuple]) -> tuple:
+    """Convert form fields to a SQL param tuple using (name, caster, default) schema."""
+    return tuple(caster(form.get(name, default)) for name, caster, default in schema)
+
+
+# Column order matches the INSERT/UPDATE statements below (id excluded)
+CITY_SCHEMA = [
+    ("label", str, ""),
+    ("lat", _clamped_float(-90.0, 90.0), 0.0),
+    ("lon", _clamped_float(-180.0, 180.0), 0.0),
+    ("tz", str, "UTC"),
+    ("enabled", _checkbox, None),
+    ("priority", int, 0),
+    ("units", str, "metric"),
+]
+
+SOURCE_SCHEMA = [
+    ("type", str, "rss"),
+    ("label", str, ""),
+    ("url", str, ""),
+    ("enabled", _checkbox, None),
+    ("weight", float, 1.0),
+    ("category", str, "general"),
+    ("poll_interval_seconds", int, 300),
+]
+
+HOST_SCHEMA = [
+    ("label", str, ""),
+    ("personality_prompt", str, ""),
+    ("is_breaking_host", _checkbox, None),
+    ("enabled", _checkbox, None),
+    ("tts_provider", str, "piper"),
+    ("tts_voice_id", str, ""),
+]
+
+
 # --- Auth ---
 @router.get("/admin/login", response_class=HTMLResponse)
 async def login_page(request: Request):
-    return templates.TemplateResponse("login.html", {"request": request})
+    return render("login.html", {"request": request})
 
 
 @router.post("/admin/login")
 async def login(request: Request):
     form = await request.form()
     password = form.get("password", "")
-    if password == HERMES_API_KEY:
-        session_id = uuid.uuid4().hex
-        # Evict oldest sessions if at capacity
-        if len(_sessions) >= _MAX_SESSIONS:
-            _sessions.clear()
-        _sessions.add(session_id)
+    if isinstance(password, str) and _key_matches(password):
         response = _redirect("/admin/")
-        response.set_cookie("hermes_session", session_id, httponly=True, max_age=86400)
+        response.set_cookie("hermes_session", _new_session(), httponly=True, max_age=_SESSION_TTL)
         return response
-    return templates.TemplateResponse(
+    return render(
         "login.html", {"request": request, "error": "Invalid password"}
     )
 
 
 @router.get("/admin/logout")
 async def logout(request: Request):
-    session = request.cookies.get("hermes_session")
-    if session in _sessions:
-        _sessions.discard(session)
+    await _revoke_session(_get_session(request))
     response = _redirect("/admin/login")
     response.delete_cookie("hermes_session")
     return response
 
 
 # --- Dashboard ---
+# Today's counts come from one pass over the (created_at, status) index
+_DASHBOARD_QUERY = """WITH today AS (
+    SELECT COUNT(*) FILTER (WHERE status = 'PLAYED') AS played,
+           COUNT(*) FILTER (WHERE status = 'FAILED') AS failed
+      FROM break_queue WHERE created_at > date('now'))
+SELECT today.played, today.failed,
+    (SELECT json_group_object(status, cnt)
+       FROM (SELECT status, COUNT(*) AS cnt FROM feed_health GROUP BY status)) AS feed_health,
+    (SELECT json_object('host_id', host_id, 'type', type,
+                        'degradation_level', degradation_level,
+                        'played_at', played_at, 'script_text', script_text)
+       FROM break_queue WHERE status='PLAYED' ORDER BY played_at DESC LIMIT 1) AS last_break,
+    (SELECT value FROM settings WHERE key = 'quiet_mode') AS quiet_mode,
+    (SELECT json_group_object(id, label) FROM hosts) AS host_names
+  FROM today"""
+
+
 @router.get("/admin/", response_class=HTMLResponse)
 async def dashboard(request: Request, _=Depends(require_api_key)):
-    db = await get_db()
-
     # Scheduler status
-    from core.services.scheduler import scheduler
     sched = scheduler.status()
 
-    # Stats today
-    cursor = await db.execute(
-        """SELECT
-            SUM(CASE WHEN status='PLAYED' THEN 1 ELSE 0 END) as played,
-            SUM(CASE WHEN status='FAILED' THEN 1 ELSE 0 END) as failed
-           FROM break_queue WHERE created_at > date('now')"""
-    )
-    stats = await cursor.fetchone()
-
-    # Feed health
-    cursor = await db.execute(
-        "SELECT status, COUNT(*) as cnt FROM feed_health GROUP BY status"
-    )
-    feed_health = {r["status"]: r["cnt"] for r in await cursor.fetchall()}
-
-    # Last break
-    cursor = await db.execute(
-        "SELECT * FROM break_queue WHERE status='PLAYED' ORDER BY played_at DESC LIMIT 1"
-    )
-    last_break = await cursor.fetchone()
-
-    # Settings
-    cursor = await db.execute("SELECT key, value FROM settings WHERE key = 'quiet_mode'")
-    qm = await cursor.fetchone()
-
-    # Host names for display
-    cursor = await db.execute("SELECT id, label FROM hosts")
-    host_names = {r["id"]: r["label"] for r in await cursor.fetchall()}
+    # Stats, feed health, last break, quiet mode and host names in one round-trip
+    row = await read_one(_DASHBOARD_QUERY)
 
-    return templates.TemplateResponse("dashboard.html", _template_ctx(
+    return render("dashboard.html", _template_ctx(
         request, "dashboard",
         scheduler_running=sched["running"],
-        breaks_played=(stats["played"] or 0) if stats else 0,
-        breaks_failed=(stats["failed"] or 0) if stats else 0,
-        feed_health=feed_health,
-        last_break=dict(last_break) if last_break else None,
-        quiet_mode=qm["value"] == "true" if qm else False,
-        host_names=host_names,
+        breaks_played=row["played"] or 0,
+        breaks_failed=row["failed"] or 0,
+        feed_health=orjson.loads(row["feed_health"]),
+        last_break=orjson.loads(row["last_break"]) if row["last_break"] else None,
+        quiet_mode=row["quiet_mode"] == "true",
+        host_names=orjson.loads(row["host_names"]),
     ))
 
 
 # --- Settings ---
+_UPSERT_SETTING = """INSERT INTO settings (key, value, updated_at) VALUES (?, ?, datetime('now'))
+   ON CONFLICT(key) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at"""
+
+_RULES_KEYS = frozenset({
+    "break_interval_minutes", "cooldown_seconds",
+    "break_timeout_seconds", "quiet_hours_start",
+    "quiet_hours_end", "breaking_score_threshold", "news_dedupe_window_minutes",
+    "break_min_words", "break_max_words", "break_max_chars",
+    "breaking_min_words", "breaking_max_words",
+    "dialog_mode", "dialog_characters",
+})
+
+
 @router.get("/admin/rules", response_class=HTMLResponse)
 async def rules_page(request: Request, _=Depends(require_api_key)):
-    db = await get_db()
-    cursor = await db.execute("SELECT key, value FROM settings")
-    settings = {r["key"]: r["value"] for r in await cursor.fetchall()}
-    return templates.TemplateResponse("rules.html", _template_ctx(request, "rules", settings=settings))
+    settings = await settings_cache.get_settings_cached()
+    return render("rules.html", _template_ctx(request, "rules", settings=settings))
 
 
 @router.post("/admin/rules")
@@ -178,48 +297,31 @@ async def update_rules(request: Request, _=Depends(require_api_key)):
     form = await request.form()
     db = await get_db()
 
-    for key in ["break_interval_minutes", "cooldown_seconds",
-                "break_timeout_seconds", "quiet_hours_start",
-                "quiet_hours_end", "breaking_score_threshold", "news_dedupe_window_minutes",
-                "break_min_words", "break_max_words", "break_max_chars",
-                "breaking_min_words", "breaking_max_words",
-                "dialog_mode", "dialog_characters"]:
-        val = form.get(key)
-        if val is not None:
-            await db.execute("INSERT OR IGNORE INTO settings (key, value) VALUES (?, ?)", (key, val))
-            await db.execute(
-                "UPDATE settings SET value = ?, updated_at = datetime('now') WHERE key = ?",
-                (val, key),
-            )
-
+    # Single pass over the submitted fields; unknown keys are ignored
+    rows = [(key, form[key]) for key in form if key in _RULES_KEYS]
     # Handle quiet_mode checkbox explicitly (unchecked = not sent by HTML)
-    quiet_val = "true" if form.get("quiet_mode") == "on" else "false"
-    await db.execute(
-        "UPDATE settings SET value = ?, updated_at = datetime('now') WHERE key = 'quiet_mode'",
-        (quiet_val,),
-    )
-
+    rows.append(("quiet_mode", "true" if form.get("quiet_mode") == "on" else "false"))
+    await db.executemany(_UPSERT_SETTING, rows)
     await db.commit()
+    settings_cache.invalidate()
     return _redirect("/admin/rules?flash=Rules+saved&flash_type=success", status_code=303)
 
 
 # --- API Settings ---
 @router.get("/api/admin/settings")
 async def get_settings(_=Depends(require_api_key)):
-    db = await get_db()
-    cursor = await db.execute("SELECT key, value FROM settings")
-    return {r["key"]: r["value"] for r in await cursor.fetchall()}
+    return await settings_cache.get_settings_cached()
 
 
 @router.put("/api/admin/settings")
 async def update_settings(body: dict, _=Depends(require_api_key)):
     db = await get_db()
-    for key, val in body.items():
-        await db.execute(
-            "UPDATE settings SET value = ?, updated_at = datetime('now') WHERE key = ?",
-            (str(val), key),
-        )
+    await db.executemany(
+        "UPDATE settings SET value = ?, updated_at = datetime('now') WHERE key = ?",
+        [(str(val), key) for key, val in body.items()],
+    )
     await db.commit()
+    settings_cache.invalidate()
     return {"status": "ok"}
 
 
@@ -227,9 +329,13 @@ async def update_settings(body: dict, _=Depends(require_api_key)):
 @router.get("/admin/cities", response_class=HTMLResponse)
 async def cities_page(request: Request, _=Depends(require_api_key)):
     db = await get_db()
-    cursor = await db.execute("SELECT * FROM cities ORDER BY priority")
-    cities = [dict(r) for r in await cursor.fetchall()]
-    return templates.TemplateResponse("cities.html", _template_ctx(request, "cities", cities=cities))
+    rows = await db.execute_fetchall("SELECT * FROM cities ORDER BY priority")
+    return render("cities.html", _template_ctx(request, "cities", cities=rows))
+
+
+_INSERT_CITY = """INSERT INTO cities (id, label, lat, lon, tz, enabled, priority, units)
+   VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+   ON CONFLICT(id) DO NOTHING RETURNING id"""
 
 
 @router.post("/admin/cities")
@@ -238,51 +344,33 @@ async def create_city(request: Request, _=Depends(require_api_key)):
     db = await get_db()
 
     # Generate and validate city ID
-    raw_id = form.get("id") or form.get("label", "city").lower().replace(" ", "_")
-    city_id = re.sub(r'[^a-z0-9_-]', '', raw_id.lower().strip())
+    raw_id = form.get("id") or form.get("label", "city").replace(" ", "_")
+    city_id = _ID_RE.sub('', raw_id.lower().strip())
     if not city_id:
         return _redirect("/admin/cities?flash=Invalid+city+ID&flash_type=error", status_code=303)
 
-    # Check for duplicate
-    cursor = await db.execute("SELECT id FROM cities WHERE id = ?", (city_id,))
-    if await cursor.fetchone():
-        from urllib.parse import quote
-        msg = f"City ID '{city_id}' already exists"
-        return _redirect(f"/admin/cities?flash={quote(msg)}&flash_type=error")
-
-    # Validate lat/lon
     try:
-        lat = max(-90.0, min(90.0, float(form.get("lat", 0))))
-        lon = max(-180.0, min(180.0, float(form.get("lon", 0))))
+        values = _parse_form(form, CITY_SCHEMA)
     except (ValueError, TypeError):
         return _redirect("/admin/cities?flash=Invalid+coordinates&flash_type=error", status_code=303)
 
-    await db.execute(
-        """INSERT INTO cities (id, label, lat, lon, tz, enabled, priority, units)
-           VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-        (
-            city_id,
-            form.get("label", ""),
-            lat,
-            lon,
-            form.get("tz", "UTC"),
-            1 if form.get("enabled") == "on" else 0,
-            int(form.get("priority", 0)),
-            form.get("units", "metric"),
-        ),
-    )
+    # Insert unless the ID is taken (no row returned = duplicate)
+    cursor = await db.execute(_INSERT_CITY, (city_id, *values))
+    inserted = await cursor.fetchone()
     await db.commit()
+    if inserted is None:
+        msg = f"City ID '{city_id}' already exists"
+        return _redirect(f"/admin/cities?flash={quote(msg)}&flash_type=error")
     return _redirect("/admin/cities?flash=City+added&flash_type=success", status_code=303)
 
 
 @router.get("/admin/cities/{city_id}", response_class=HTMLResponse)
 async def edit_city_page(city_id: str, request: Request, _=Depends(require_api_key)):
     db = await get_db()
-    cursor = await db.execute("SELECT * FROM cities WHERE id = ?", (city_id,))
-    city = await cursor.fetchone()
+    city = await fetch_one(db, "SELECT * FROM cities WHERE id = ?", (city_id,))
     if not city:
         return _redirect("/admin/cities?flash=City+not+found&flash_type=error", status_code=303)
-    return templates.TemplateResponse("city_edit.html", _template_ctx(
+    return render("city_edit.html", _template_ctx(
         request, "cities", city=dict(city),
     ))
 
@@ -293,24 +381,14 @@ async def update_city(city_id: str, request: Request, _=Depends(require_api_key)
     db = await get_db()
 
     try:
-        lat = max(-90.0, min(90.0, float(form.get("lat", 0))))
-        lon = max(-180.0, min(180.0, float(form.get("lon", 0))))
+        values = _parse_form(form, CITY_SCHEMA)
     except (ValueError, TypeError):
-        lat, lon = 0.0, 0.0
+        return _redirect(f"/admin/cities/{city_id}?flash=Invalid+coordinates&flash_type=error")
 
     await db.execute(
         """UPDATE cities SET label = ?, lat = ?, lon = ?, tz = ?,
            enabled = ?, priority = ?, units = ? WHERE id = ?""",
-        (
-            form.get("label", ""),
-            lat,
-            lon,
-            form.get("tz", "UTC"),
-            1 if form.get("enabled") == "on" else 0,
-            int(form.get("priority", 0)),
-            form.get("units", "metric"),
-            city_id,
-        ),
+        (*values, city_id),
     )
     await db.commit()
     return _redirect("/admin/cities?flash=City+updated&flash_type=success", status_code=303)
@@ -328,30 +406,28 @@ async def delete_city(city_id: str, _=Depends(require_api_key)):
 @router.get("/api/admin/cities")
 async def api_list_cities(_=Depends(require_api_key)):
     db = await get_db()
-    cursor = await db.execute("SELECT * FROM cities ORDER BY priority")
-    return [dict(r) for r in await cursor.fetchall()]
+    rows = await db.execute_fetchall("SELECT * FROM cities ORDER BY priority")
+    return [dict(r) for r in rows]
 
 
 @router.post("/api/admin/cities")
 async def api_create_city(body: dict, _=Depends(require_api_key)):
     db = await get_db()
-    city_id = body.get("id") or body.get("label", "city").lower().replace(" ", "_")
-    city_id = re.sub(r'[^a-z0-9_-]', '', city_id.lower().strip())
+    raw_id = body.get("id") or body.get("label", "city").replace(" ", "_")
+    city_id = _ID_RE.sub('', raw_id.lower().strip())
 
-    cursor = await db.execute("SELECT id FROM cities WHERE id = ?", (city_id,))
-    if await cursor.fetchone():
-        return {"status": "error", "detail": f"City ID '{city_id}' already exists"}
-
-    await db.execute(
-        """INSERT INTO cities (id, label, lat, lon, tz, enabled, priority, units)
-           VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+    cursor = await db.execute(
+        _INSERT_CITY,
         (
             city_id, body.get("label"), body.get("lat"), body.get("lon"),
             body.get("tz", "UTC"), body.get("enabled", True),
             body.get("priority", 0), body.get("units", "metric"),
         ),
     )
+    inserted = await cursor.fetchone()
     await db.commit()
+    if inserted is None:
+        return {"status": "error", "detail": f"City ID '{city_id}' already exists"}
     return {"status": "ok", "id": city_id}
 
 
@@ -367,14 +443,13 @@ async def api_delete_city(city_id: str, _=Depends(require_api_key)):
 @router.get("/admin/sources", response_class=HTMLResponse)
 async def sources_page(request: Request, _=Depends(require_api_key)):
     db = await get_db()
-    cursor = await db.execute(
+    rows = await db.execute_fetchall(
         """SELECT ns.*, fh.status as health_status, fh.consecutive_failures, fh.last_success
            FROM news_sources ns
            LEFT JOIN feed_health fh ON fh.source_id = ns.id
            ORDER BY ns.label"""
     )
-    sources = [dict(r) for r in await cursor.fetchall()]
-    return templates.TemplateResponse("sources.html", _template_ctx(request, "sources", sources=sources))
+    return render("sources.html", _template_ctx(request, "sources", sources=rows))
 
 
 @router.post("/admin/sources")
@@ -382,41 +457,35 @@ async def create_source(request: Request, _=Depends(require_api_key)):
     form = await request.form()
     db = await get_db()
 
-    raw_id = form.get("id") or form.get("label", "src").lower().replace(" ", "_")
-    src_id = re.sub(r'[^a-z0-9_-]', '', raw_id.lower().strip())
+    raw_id = form.get("id") or form.get("label", "src").replace(" ", "_")
+    src_id = _ID_RE.sub('', raw_id.lower().strip())
     if not src_id:
         return _redirect("/admin/sources?flash=Invalid+source+ID&flash_type=error", status_code=303)
 
-    # Check for duplicate
-    cursor = await db.execute("SELECT id FROM news_sources WHERE id = ?", (src_id,))
-    if await cursor.fetchone():
-        from urllib.parse import quote
-        msg = f"Source ID '{src_id}' already exists"
-        return _redirect(f"/admin/sources?flash={quote(msg)}&flash_type=error")
-
-    await db.execute(
+    # Insert unless the ID is taken (no row returned = duplicate)
+    cursor = await db.execute(
         """INSERT INTO news_sources (id, type, label, url, enabled, weight, category, poll_interval_seconds)
-           VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-        (
-            src_id, form.get("type", "rss"), form.get("label", ""),
-            form.get("url", ""), 1 if form.get("enabled") == "on" else 0,
-            float(form.get("weight", 1.0)), form.get("category", "general"),
-            int(form.get("poll_interval_seconds", 300)),
-        ),
+           VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+           ON CONFLICT(id) DO NOTHING RETURNING id""",
+        (src_id, *_parse_form(form, SOURCE_SCHEMA)),
     )
-    await db.execute("INSERT OR IGNORE INTO feed_health (source_id) VALUES (?)", (src_id,))
+    inserted = await cursor.fetchone()
+    if inserted is not None:
+        await db.execute("INSERT OR IGNORE INTO feed_health (source_id) VALUES (?)", (src_id,))
     await db.commit()
+    if inserted is None:
+        msg = f"Source ID '{src_id}' already exists"
+        return _redirect(f"/admin/sources?flash={quote(msg)}&flash_type=error")
     return _redirect("/admin/sources?flash=Source+added&flash_type=success", status_code=303)
 
 
 @router.get("/admin/sources/{src_id}", response_class=HTMLResponse)
 async def edit_source_page(src_id: str, request: Request, _=Depends(require_api_key)):
     db = await get_db()
-    cursor = await db.execute("SELECT * FROM news_sources WHERE id = ?", (src_id,))
-    source = await cursor.fetchone()
+    source = await fetch_one(db, "SELECT * FROM news_sources WHERE id = ?", (src_id,))
     if not source:
         return _redirect("/admin/sources?flash=Source+not+found&flash_type=error", status_code=303)
-    return templates.TemplateResponse("source_edit.html", _template_ctx(
+    return render("source_edit.html", _template_ctx(
         request, "sources", source=dict(source),
     ))
 
@@ -429,16 +498,7 @@ async def update_source(src_id: str, request: Request, _=Depends(require_api_key
         """UPDATE news_sources SET type = ?, label = ?, url = ?,
            enabled = ?, weight = ?, category = ?, poll_interval_seconds = ?
            WHERE id = ?""",
-        (
-            form.get("type", "rss"),
-            form.get("label", ""),
-            form.get("url", ""),
-            1 if form.get("enabled") == "on" else 0,
-            float(form.get("weight", 1.0)),
-            form.get("category", "general"),
-            int(form.get("poll_interval_seconds", 300)),
-            src_id,
-        ),
+        (*_parse_form(form, SOURCE_SCHEMA), src_id),
     )
     await db.commit()
     return _redirect("/admin/sources?flash=Source+updated&flash_type=success", status_code=303)
@@ -456,9 +516,8 @@ async def delete_source(src_id: str, _=Depends(require_api_key)):
 @router.get("/admin/hosts", response_class=HTMLResponse)
 async def hosts_page(request: Request, _=Depends(require_api_key)):
     db = await get_db()
-    cursor = await db.execute("SELECT * FROM hosts ORDER BY id")
-    hosts = [dict(r) for r in await cursor.fetchall()]
-    return templates.TemplateResponse("hosts.html", _template_ctx(request, "hosts", hosts=hosts))
+    rows = await db.execute_fetchall("SELECT * FROM hosts ORDER BY id")
+    return render("hosts.html", _template_ctx(request, "hosts", hosts=rows))
 
 
 @router.post("/admin/hosts/{host_id}")
@@ -470,17 +529,10 @@ async def update_host(host_id: str, request: Request, _=Depends(require_api_key)
            is_breaking_host = ?, enabled = ?,
            tts_provider = ?, tts_voice_id = ?
            WHERE id = ?""",
-        (
-            form.get("label", ""),
-            form.get("personality_prompt", ""),
-            1 if form.get("is_breaking_host") == "on" else 0,
-            1 if form.get("enabled") == "on" else 0,
-            form.get("tts_provider", "piper"),
-            form.get("tts_voice_id", ""),
-            host_id,
-        ),
+        (*_parse_form(form, HOST_SCHEMA), host_id),
     )
     await db.commit()
+    hosts_cache.invalidate()
     return _redirect("/admin/hosts?flash=Host+updated&flash_type=success", status_code=303)
 
 
@@ -488,25 +540,23 @@ async def update_host(host_id: str, request: Request, _=Depends(require_api_key)
 @router.get("/admin/tts", response_class=HTMLResponse)
 async def tts_settings_page(request: Request, _=Depends(require_api_key)):
     db = await get_db()
-    cursor = await db.execute(
+    rows = await db.execute_fetchall(
         "SELECT key, value FROM settings WHERE key IN ('elevenlabs_api_key', 'openai_tts_model', 'tts_default_provider')"
     )
-    settings = {r["key"]: r["value"] for r in await cursor.fetchall()}
-    return templates.TemplateResponse("tts_settings.html", _template_ctx(request, "tts", settings=settings))
+    settings = {r["key"]: r["value"] for r in rows}
+    return render("tts_settings.html", _template_ctx(request, "tts", settings=settings))
+
+
+_TTS_KEYS = frozenset({"elevenlabs_api_key", "openai_tts_model", "tts_default_provider"})
 
 
 @router.post("/admin/tts")
 async def update_tts_settings(request: Request, _=Depends(require_api_key)):
     form = await request.form()
     db = await get_db()
-    for key in ["elevenlabs_api_key", "openai_tts_model", "tts_default_provider"]:
-        val = form.get(key)
-        if val is not None:
-            await db.execute(
-                "INSERT OR REPLACE INTO settings (key, value, updated_at) VALUES (?, ?, datetime('now'))",
-                (key, val),
-            )
+    await db.executemany(_UPSERT_SETTING, [(key, form[key]) for key in form if key in _TTS_KEYS])
     await db.commit()
+    settings_cache.invalidate()
     return _redirect("/admin/tts?flash=TTS+settings+saved&flash_type=success", status_code=303)
 
 
@@ -514,12 +564,15 @@ async def update_tts_settings(request: Request, _=Depends(require_api_key)):
 @router.get("/admin/bitcoin", response_class=HTMLResponse)
 async def bitcoin_settings_page(request: Request, _=Depends(require_api_key)):
     db = await get_db()
-    cursor = await db.execute(
+    rows = await db.execute_fetchall(
         "SELECT key, value FROM settings WHERE key IN "
         "('bitcoin_enabled', 'bitcoin_api_key', 'bitcoin_cache_ttl')"
     )
-    settings = {r["key"]: r["value"] for r in await cursor.fetchall()}
-    return templates.TemplateResponse("bitcoin_settings.html", _template_ctx(request, "bitcoin", settings=settings))
+    settings = {r["key"]: r["value"] for r in rows}
+    return render("bitcoin_settings.html", _template_ctx(request, "bitcoin", settings=settings))
+
+
+_BITCOIN_KEYS = frozenset({"bitcoin_api_key", "bitcoin_cache_ttl"})
 
 
 @router.post("/admin/bitcoin")
@@ -528,21 +581,11 @@ async def update_bitcoin_settings(request: Request, _=Depends(require_api_key)):
     db = await get_db()
 
     # Handle checkbox (unchecked = not sent)
-    enabled = "true" if form.get("bitcoin_enabled") == "on" else "false"
-    await db.execute(
-        "INSERT OR REPLACE INTO settings (key, value, updated_at) VALUES (?, ?, datetime('now'))",
-        ("bitcoin_enabled", enabled),
-    )
-
-    for key in ["bitcoin_api_key", "bitcoin_cache_ttl"]:
-        val = form.get(key)
-        if val is not None:
-            await db.execute(
-                "INSERT OR REPLACE INTO settings (key, value, updated_at) VALUES (?, ?, datetime('now'))",
-                (key, val),
-            )
-
+    rows = [("bitcoin_enabled", "true" if form.get("bitcoin_enabled") == "on" else "false")]
+    rows += [(key, form[key]) for key in form if key in _BITCOIN_KEYS]
+    await db.executemany(_UPSERT_SETTING, rows)
     await db.commit()
+    settings_cache.invalidate()
     return _redirect("/admin/bitcoin?flash=Bitcoin+settings+saved&flash_type=success", status_code=303)
 
 
@@ -550,9 +593,8 @@ async def update_bitcoin_settings(request: Request, _=Depends(require_api_key)):
 @router.get("/admin/prompts", response_class=HTMLResponse)
 async def prompts_page(request: Request, _=Depends(require_api_key)):
     db = await get_db()
-    cursor = await db.execute("SELECT value FROM settings WHERE key = 'master_prompt'")
-    row = await cursor.fetchone()
-    return templates.TemplateResponse("prompts.html", _template_ctx(
+    row = await fetch_one(db, "SELECT value FROM settings WHERE key = 'master_prompt'")
+    return render("prompts.html", _template_ctx(
         request, "prompts",
         master_prompt=row["value"] if row else "",
     ))
@@ -567,52 +609,80 @@ async def update_prompts(request: Request, _=Depends(require_api_key)):
         (form.get("master_prompt", ""),),
     )
     await db.commit()
+    settings_cache.invalidate()
     return _redirect("/admin/prompts?flash=Prompt+saved&flash_type=success", status_code=303)
 
 
 # --- Videos ---
-def _parse_video_break(row) -> dict | None:
-    """Parse a break row into video info dict."""
+_VIDEO_QUERY = """SELECT id, host_id, type, played_at, created_at, script_text,
+       json_extract(meta_json, '$.video_path') AS video_path,
+       json_extract(meta_json, '$.hls_video_path') AS hls_video_path,
+       json_extract(meta_json, '$.host') AS meta_host,
+       json_extract(meta_json, '$.headlines') AS headlines,
+       json_extract(meta_json, '$.bitcoin') AS bitcoin
+   FROM break_queue
+   WHERE status = 'PLAYED' AND has_video = 1
+   ORDER BY played_at DESC LIMIT ?"""
+
+# Names of the per-break HLS dirs under HLS_VIDEO_DIR: (dir mtime_ns, names)
+_hls_dirs: tuple[int, frozenset[str]] = (-1, frozenset())
+# Skip even the directory stat for polls landing within this window
+_HLS_STAT_TTL = 1.0
+_hls_checked_at = 0.0
+
+
+def _hls_dir_names() -> frozenset[str]:
+    """One scandir of HLS_VIDEO_DIR instead of a stat per video row.
+
+    Cached until the directory's mtime changes (a break dir added or pruned);
+    the mtime itself is re-checked at most once per _HLS_STAT_TTL.
+    """
+    global _hls_dirs, _hls_checked_at
+    now = time.monotonic()
+    if now - _hls_checked_at < _HLS_STAT_TTL:
+        return _hls_dirs[1]
+    try:
+        mtime = HLS_VIDEO_DIR.stat().st_mtime_ns
+    except FileNotFoundError:
+        _hls_dirs = (-1, frozenset())
+        return _hls_dirs[1]
+    if _hls_dirs[0] != mtime:
+        with os.scandir(HLS_VIDEO_DIR) as it:
+            _hls_dirs = (mtime, frozenset(e.name for e in it if e.is_dir()))
+    _hls_checked_at = now
+    return _hls_dirs[1]
+
+
+def _parse_video_break(row, hls_dirs: frozenset[str]) -> dict | None:
+    """Build video info dict from a row of _VIDEO_QUERY."""
     d = dict(row)
-    meta = {}
-    if d.get("meta_json"):
-        try:
-            meta = json.loads(d["meta_json"])
-        except (json.JSONDecodeError, TypeError):
-            pass
-    video_path = meta.get("video_path")
+    video_path = d["video_path"]
     if not video_path:
         return None
-    from pathlib import Path as _P
-    video_filename = _P(video_path).name
-    hls_video_path = meta.get("hls_video_path")
-    has_hls = bool(hls_video_path and _P(hls_video_path).parent.exists())
+    video_filename = Path(video_path).name
+    hls_video_path = d["hls_video_path"]
+    has_hls = bool(hls_video_path and Path(hls_video_path).parent.name in hls_dirs)
     return {
         "break_id": d["id"],
         "played_at": d.get("played_at") or d.get("created_at"),
-        "host_id": meta.get("host", d.get("host_id", "")),
+        "host_id": d["meta_host"] or d.get("host_id", ""),
         "type": d.get("type", ""),
         "script_text": d.get("script_text", ""),
         "video_filename": video_filename,
         "mp4_url": f"/video/{video_filename}",
         "hls_url": f"/hls-video/{d['id']}/index.m3u8" if has_hls else None,
-        "headlines": meta.get("headlines", 0),
-        "bitcoin": meta.get("bitcoin", False),
+        "headlines": d["headlines"] or 0,
+        "bitcoin": bool(d["bitcoin"]),
     }
 
 
 @router.get("/api/video/list")
 async def api_video_list(_=Depends(require_api_key)):
-    db = await get_db()
-    cursor = await db.execute(
-        """SELECT id, host_id, type, played_at, created_at, script_text, meta_json
-           FROM break_queue
-           WHERE status = 'PLAYED' AND meta_json LIKE '%video_path%'
-           ORDER BY played_at DESC LIMIT 20"""
-    )
+    rows = await read_all(_VIDEO_QUERY, (20,))
+    hls_dirs = _hls_dir_names()
     results = []
-    for row in await cursor.fetchall():
-        info = _parse_video_break(row)
+    for row in rows:
+        info = _parse_video_break(row, hls_dirs)
         if info:
             results.append(info)
     return results
@@ -620,40 +690,27 @@ async def api_video_list(_=Depends(require_api_key)):
 
 @router.get("/api/video/latest")
 async def api_video_latest():
-    db = await get_db()
-    cursor = await db.execute(
-        """SELECT id, host_id, type, played_at, created_at, script_text, meta_json
-           FROM break_queue
-           WHERE status = 'PLAYED' AND meta_json LIKE '%video_path%'
-           ORDER BY played_at DESC LIMIT 1"""
-    )
-    row = await cursor.fetchone()
+    row = await read_one(_VIDEO_QUERY, (1,))
     if not row:
         return {"break_id": None}
-    info = _parse_video_break(row)
+    info = _parse_video_break(row, _hls_dir_names())
     return info or {"break_id": None}
 
 
 @router.get("/admin/videos", response_class=HTMLResponse)
 async def videos_page(request: Request, _=Depends(require_api_key)):
-    db = await get_db()
-    cursor = await db.execute(
-        """SELECT id, host_id, type, played_at, created_at, script_text, meta_json
-           FROM break_queue
-           WHERE status = 'PLAYED' AND meta_json LIKE '%video_path%'
-           ORDER BY played_at DESC LIMIT 20"""
+    rows, host_names = await asyncio.gather(
+        read_all(_VIDEO_QUERY, (20,)),
+        hosts_cache.get_host_names(),
     )
+    hls_dirs = _hls_dir_names()
     videos = []
-    for row in await cursor.fetchall():
-        info = _parse_video_break(row)
+    for row in rows:
+        info = _parse_video_break(row, hls_dirs)
         if info:
             videos.append(info)
 
-    # Host names
-    cursor = await db.execute("SELECT id, label FROM hosts")
-    host_names = {r["id"]: r["label"] for r in await cursor.fetchall()}
-
-    return templates.TemplateResponse("videos.html", _template_ctx(
+    return render("videos.html", _template_ctx(
         request, "videos", videos=videos, host_names=host_names,
     ))
 
@@ -665,7 +722,7 @@ async def visual_guide_page(request: Request, _=Depends(require_api_key)):
         WIDE_SHOT_INTERVAL, REACTION_PROBABILITY,
         TRANSITION_CUT, TRANSITION_DISSOLVE, TRANSITION_FADE_BLACK,
     )
-    return templates.TemplateResponse("visual_guide.html", _template_ctx(
+    return render("visual_guide.html", _template_ctx(
         request, "visual-guide",
         wide_interval=WIDE_SHOT_INTERVAL,
         reaction_pct=int(REACTION_PROBABILITY * 100),
@@ -678,52 +735,67 @@ async def visual_guide_page(request: Request, _=Depends(require_api_key)):
 # --- Breaking page ---
 @router.get("/admin/breaking", response_class=HTMLResponse)
 async def breaking_page(request: Request, _=Depends(require_api_key)):
-    return templates.TemplateResponse("breaking.html", _template_ctx(request, "breaking"))
+    return render("breaking.html", _template_ctx(request, "breaking"))
 
 
 # --- Characters ---
 _PNG_MAGIC = b'\x89PNG\r\n\x1a\n'
 _MAX_UPLOAD = 5 * 1024 * 1024  # 5 MB
+_UPLOAD_CHUNK = 64 * 1024
 
 
 def _char_assets_dir(char_id: str) -> Path:
     return Path(ASSETS_DIR) / "characters" / char_id
 
 
-def _scan_emotions(char_id: str) -> list[dict]:
-    """Scan character dir for emotion PNGs (e.g. smile_idle.png)."""
+# Asset scan cache: char_id -> (dir mtime_ns, png names, emotions)
+_emotion_cache: dict[str, tuple[int, frozenset[str], list[dict]]] = {}
+
+
+def _scan_assets(char_id: str) -> tuple[frozenset[str], list[dict]]:
+    """Scan character dir once for its PNGs and emotion variants (e.g. smile_idle.png).
+
+    Cached per character until the directory's mtime changes.
+    """
     d = _char_assets_dir(char_id)
+    try:
+        mtime = d.stat().st_mtime_ns
+    except FileNotFoundError:
+        return frozenset(), []
+    cached = _emotion_cache.get(char_id)
+    if cached and cached[0] == mtime:
+        return cached[1], cached[2]
+    with os.scandir(d) as it:
+        names = sorted(e.name for e in it if e.name.endswith(".png") and e.is_file())
     emotions = []
-    if not d.exists():
-        return emotions
-    for f in sorted(d.iterdir()):
-        if f.suffix != ".png" or f.name in ("idle.png", "talking.png"):
+    for name in names:
+        if name in ("idle.png", "talking.png"):
             continue
         # emotion files: {emotion}_{variant}.png
-        parts = f.stem.rsplit("_", 1)
+        parts = name[:-4].rsplit("_", 1)
         if len(parts) == 2 and parts[1] in ("idle", "talking"):
-            emotions.append({"name": parts[0], "variant": parts[1], "filename": f.name})
-    return emotions
+            emotions.append({"name": parts[0], "variant": parts[1], "filename": name})
+    on_disk = frozenset(names)
+    _emotion_cache[char_id] = (mtime, on_disk, emotions)
+    return on_disk, emotions
 
 
 @router.get("/admin/characters", response_class=HTMLResponse)
 async def characters_page(request: Request, _=Depends(require_api_key)):
     db = await get_db()
-    cursor = await db.execute("SELECT * FROM characters ORDER BY id")
-    rows = [dict(r) for r in await cursor.fetchall()]
+    rows = [dict(r) for r in await db.execute_fetchall("SELECT * FROM characters ORDER BY id")]
 
     # Host labels for display
-    cursor = await db.execute("SELECT id, label FROM hosts")
-    host_map = {r["id"]: r["label"] for r in await cursor.fetchall()}
+    host_map = await hosts_cache.get_host_names()
 
     for ch in rows:
-        d = _char_assets_dir(ch["id"])
-        ch["has_idle"] = (d / "idle.png").exists()
-        ch["has_talking"] = (d / "talking.png").exists()
-        ch["emotion_count"] = len(_scan_emotions(ch["id"]))
+        on_disk, emotions = _scan_assets(ch["id"])
+        ch["has_idle"] = "idle.png" in on_disk
+        ch["has_talking"] = "talking.png" in on_disk
+        ch["emotion_count"] = len(emotions)
         ch["host_label"] = host_map.get(ch.get("host_id", ""), "")
 
-    return templates.TemplateResponse("characters.html", _template_ctx(
+    return render("characters.html", _template_ctx(
         request, "characters", characters=rows,
     ))
 
@@ -734,13 +806,11 @@ async def create_character(request: Request, _=Depends(require_api_key)):
     db = await get_db()
 
     raw_id = form.get("id", "").strip()
-    char_id = re.sub(r'[^a-z0-9_-]', '', raw_id.lower())
+    char_id = _ID_RE.sub('', raw_id.lower())
     if not char_id:
         return _redirect("/admin/characters?flash=Invalid+character+ID&flash_type=error")
 
-    cursor = await db.execute("SELECT id FROM characters WHERE id = ?", (char_id,))
-    if await cursor.fetchone():
-        from urllib.parse import quote
+    if await fetch_one(db, "SELECT id FROM characters WHERE id = ?", (char_id,)):
         return _redirect(f"/admin/characters?flash={quote(f'ID {char_id} already exists')}&flash_type=error")
 
     label = form.get("label", char_id).strip()
@@ -759,22 +829,20 @@ async def create_character(request: Request, _=Depends(require_api_key)):
 @router.get("/admin/characters/{char_id}", response_class=HTMLResponse)
 async def edit_character_page(char_id: str, request: Request, _=Depends(require_api_key)):
     db = await get_db()
-    cursor = await db.execute("SELECT * FROM characters WHERE id = ?", (char_id,))
-    row = await cursor.fetchone()
+    row = await fetch_one(db, "SELECT * FROM characters WHERE id = ?", (char_id,))
     if not row:
         return _redirect("/admin/characters?flash=Character+not+found&flash_type=error")
 
     ch = dict(row)
-    d = _char_assets_dir(char_id)
-    ch["has_idle"] = (d / "idle.png").exists()
-    ch["has_talking"] = (d / "talking.png").exists()
-    ch["emotions"] = _scan_emotions(char_id)
+    on_disk, ch["emotions"] = _scan_assets(char_id)
+    ch["has_idle"] = "idle.png" in on_disk
+    ch["has_talking"] = "talking.png" in on_disk
 
     # Hosts for dropdown
-    cursor = await db.execute("SELECT id, label FROM hosts ORDER BY id")
-    hosts = [dict(r) for r in await cursor.fetchall()]
+    rows = await db.execute_fetchall("SELECT id, label FROM hosts ORDER BY id")
+    hosts = [dict(r) for r in rows]
 
-    return templates.TemplateResponse("character_edit.html", _template_ctx(
+    return render("character_edit.html", _template_ctx(
         request, "characters", char=ch, hosts=hosts,
     ))
 
@@ -784,17 +852,15 @@ async def update_character(char_id: str, request: Request, _=Depends(require_api
     form = await request.form()
     db = await get_db()
 
-    cursor = await db.execute("SELECT id FROM characters WHERE id = ?", (char_id,))
-    if not await cursor.fetchone():
-        return _redirect("/admin/characters?flash=Character+not+found&flash_type=error")
-
-    await db.execute(
+    # RETURNING hands back the saved row for the config sync (None = unknown id)
+    cursor = await db.execute(
         """UPDATE characters SET
            label = ?, gender = ?, age = ?, behavior_prompt = ?,
            piper_model = ?, host_id = ?,
            position_x = ?, position_y = ?, scale = ?,
            positions_json = ?, enabled = ?
-           WHERE id = ?""",
+           WHERE id = ?
+           RETURNING *""",
         (
             form.get("label", ""),
             form.get("gender", ""),
@@ -810,13 +876,13 @@ async def update_character(char_id: str, request: Request, _=Depends(require_api
             char_id,
         ),
     )
+    row = await cursor.fetchone()
     await db.commit()
+    if row is None:
+        return _redirect("/admin/characters?flash=Character+not+found&flash_type=error")
 
     # Sync config.json
-    cursor = await db.execute("SELECT * FROM characters WHERE id = ?", (char_id,))
-    row = dict(await cursor.fetchone())
-    from core.services.character_sync import sync_character_config
-    sync_character_config(char_id, row)
+    sync_character_config(char_id, dict(row))
 
     return _redirect(f"/admin/characters/{char_id}?flash=Character+saved&flash_type=success")
 
@@ -830,20 +896,12 @@ async def upload_character_asset(char_id: str, request: Request, _=Depends(requi
     if not file or not hasattr(file, "read"):
         return _redirect(f"/admin/characters/{char_id}?flash=No+file+provided&flash_type=error")
 
-    data = await file.read()
-
-    # Validate PNG
-    if not data[:8] == _PNG_MAGIC:
-        return _redirect(f"/admin/characters/{char_id}?flash=File+must+be+PNG&flash_type=error")
-    if len(data) > _MAX_UPLOAD:
-        return _redirect(f"/admin/characters/{char_id}?flash=File+too+large+(5MB+max)&flash_type=error")
-
     # Determine filename
     if slot in ("idle", "talking"):
         filename = f"{slot}.png"
     else:
         # Emotion upload: slot = emotion name, variant from form
-        emotion_name = re.sub(r'[^a-z0-9_]', '', slot.lower())
+        emotion_name = _EMOTION_RE.sub('', slot.lower())
         variant = form.get("variant", "idle")
         if variant not in ("idle", "talking"):
             variant = "idle"
@@ -851,9 +909,30 @@ async def upload_character_asset(char_id: str, request: Request, _=Depends(requi
             return _redirect(f"/admin/characters/{char_id}?flash=Invalid+emotion+name&flash_type=error")
         filename = f"{emotion_name}_{variant}.png"
 
+    # Validate PNG
+    head = await file.read(_UPLOAD_CHUNK)
+    if not head[:8] == _PNG_MAGIC:
+        return _redirect(f"/admin/characters/{char_id}?flash=File+must+be+PNG&flash_type=error")
+
+    # Stream to a temp file in chunks, then swap into place
     d = _char_assets_dir(char_id)
     d.mkdir(parents=True, exist_ok=True)
-    (d / filename).write_bytes(data)
+    dest = d / filename
+    part = dest.with_name(dest.name + ".part")
+    total = 0
+    with open(part, "wb") as out:
+        chunk = head
+        while chunk:
+            total += len(chunk)
+            if total > _MAX_UPLOAD:
+                break
+            out.write(chunk)
+            chunk = await file.read(_UPLOAD_CHUNK)
+    if total > _MAX_UPLOAD:
+        part.unlink(missing_ok=True)
+        return _redirect(f"/admin/characters/{char_id}?flash=File+too+large+(5MB+max)&flash_type=error")
+    part.replace(dest)
+    _emotion_cache.pop(char_id, None)
 
     return _redirect(f"/admin/characters/{char_id}?flash=Asset+uploaded&flash_type=success")
 
@@ -886,6 +965,7 @@ async def delete_character_asset(char_id: str, request: Request, _=Depends(requi
     fpath = _char_assets_dir(char_id) / safe_name
     if fpath.exists():
         fpath.unlink()
+        _emotion_cache.pop(char_id, None)
 
     return _redirect(f"/admin/characters/{char_id}?flash=Asset+deleted&flash_type=success")
 
@@ -1,53 +1,52 @@
 """Logs router — event log viewer."""
 
-from pathlib import Path
+import asyncio
 
 from fastapi import APIRouter, Depends, Request
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
 
-from core.config import BASE_PATH
-from core.database import get_db
+from core.database import read_all
 from core.routers.admin import require_api_key, _template_ctx
+from core.templating import render
 
 router = APIRouter(tags=["logs"])
-templates = Jinja2Templates(directory=str(Path(__file__).parent.parent / "templates"))
-templates.env.globals["base"] = BASE_PATH
+
+
+def _type_range(event_type: str) -> tuple[str, str]:
+    """Bounds for a prefix match on event_type, as an index-friendly range.
+
+    LIKE on a BINARY-collated column never uses the index, so
+    `type=llm` becomes `event_type >= 'llm' AND event_type < 'llm' + 1`.
+    """
+    prefix = event_type.lower()
+    return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
 
 
 @router.get("/admin/logs", response_class=HTMLResponse)
 async def logs_page(request: Request, _=Depends(require_api_key)):
-    db = await get_db()
     event_type = request.query_params.get("type", "")
     limit = min(int(request.query_params.get("limit", "50")), 200)
     offset = int(request.query_params.get("offset", "0"))
 
     if event_type:
-        cursor = await db.execute(
-            """SELECT * FROM events_log WHERE event_type LIKE ?
-               ORDER BY timestamp DESC LIMIT ? OFFSET ?""",
-            (f"%{event_type}%", limit, offset),
-        )
+        where, params = "WHERE event_type >= ? AND event_type < ?", _type_range(event_type)
     else:
-        cursor = await db.execute(
-            "SELECT * FROM events_log ORDER BY timestamp DESC LIMIT ? OFFSET ?",
-            (limit, offset),
-        )
-    logs = [dict(r) for r in await cursor.fetchall()]
+        where, params = "", ()
 
-    if event_type:
-        cursor = await db.execute(
-            "SELECT COUNT(*) as total FROM events_log WHERE event_type LIKE ?",
-            (f"%{event_type}%",),
-        )
-    else:
-        cursor = await db.execute("SELECT COUNT(*) as total FROM events_log")
-    total_row = await cursor.fetchone()
-    total = total_row["total"] if total_row else 0
+    # Each query borrows its own pooled read connection, so they run in parallel
+    rows, count_rows = await asyncio.gather(
+        read_all(
+            f"SELECT * FROM events_log {where} ORDER BY timestamp DESC LIMIT ? OFFSET ?",
+            (*params, limit, offset),
+        ),
+        read_all(f"SELECT COUNT(*) as total FROM events_log {where}", params),
+    )
+    total = count_rows[0]["total"] if count_rows else 0
 
-    return templates.TemplateResponse("logs.html", _template_ctx(
+    # sqlite3.Row supports the template's log.col lookups, no dict copy needed
+    return render("logs.html", _template_ctx(
         request, "logs",
-        logs=logs,
+        logs=rows,
         total=total,
         limit=limit,
         offset=offset,
@@ -57,22 +56,19 @@ async def logs_page(request: Request, _=Depends(require_api_key)):
 
 @router.get("/api/admin/logs")
 async def api_logs(request: Request, _=Depends(require_api_key)):
-    db = await get_db()
     event_type = request.query_params.get("type", "")
     limit = min(int(request.query_params.get("limit", "50")), 200)
     offset = int(request.query_params.get("offset", "0"))
 
     if event_type:
-        cursor = await db.execute(
-            """SELECT * FROM events_log WHERE event_type LIKE ?
-               ORDER BY timestamp DESC LIMIT ? OFFSET ?""",
-            (f"%{event_type}%", limit, offset),
-        )
+        where, params = "WHERE event_type >= ? AND event_type < ?", _type_range(event_type)
     else:
-        cursor = await db.execute(
-            "SELECT * FROM events_log ORDER BY timestamp DESC LIMIT ? OFFSET ?",
-            (limit, offset),
-        )
-    logs = [dict(r) for r in await cursor.fetchall()]
+        where, params = "", ()
+
+    rows = await read_all(
+        f"SELECT * FROM events_log {where} ORDER BY timestamp DESC LIMIT ? OFFSET ?",
+        (*params, limit, offset),
+    )
+    logs = [dict(r) for r in rows]
 
     return {"logs": logs, "total": len(logs), "offset": offset, "limit": limit}
@@ -1,73 +1,91 @@
 """Status router — health check, scheduler info, HTMX partials."""
 
+import asyncio
+import hashlib
 import time
-from pathlib import Path
 from datetime import datetime, timezone
 
+import orjson
+
 from fastapi import APIRouter, Depends, Request
-from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
 
-from core.config import HERMES_API_KEY, BASE_PATH
+from core.config import HERMES_API_KEY
 from core.routers.admin import require_api_key
-from core.database import get_db
+from core.database import get_db, read_all, read_one
+from core.services import hosts_cache, settings_cache
 from core.services.scheduler import scheduler
+from core.templating import render
 
-router = APIRouter(tags=["status"])
-templates = Jinja2Templates(directory=str(Path(__file__).parent.parent / "templates"))
-templates.env.globals["base"] = BASE_PATH
+router = APIRouter(tags=["status"], default_response_class=ORJSONResponse)
 
 _start_time = time.time()
 
 
+# Everything /api/health reads from SQLite, in one statement and one row
+_HEALTH_SQL = """WITH today AS (
+    SELECT COUNT(*) FILTER (WHERE status = 'PLAYED') AS played,
+           COUNT(*) FILTER (WHERE status = 'FAILED') AS failed
+      FROM break_queue WHERE created_at > date('now'))
+SELECT today.played, today.failed,
+    (SELECT json_group_object(status, cnt)
+       FROM (SELECT status, COUNT(*) AS cnt FROM feed_health GROUP BY status)) AS feed_stats,
+    (SELECT json_object('id', id, 'type', type, 'host', host_id,
+                        'played_at', played_at, 'degradation_level', degradation_level)
+       FROM break_queue WHERE status = 'PLAYED'
+       ORDER BY played_at DESC LIMIT 1) AS last_break
+  FROM today"""
+_STATS_TODAY_SQL = """SELECT
+    COUNT(*) FILTER (WHERE status = 'PLAYED') AS played,
+    COUNT(*) FILTER (WHERE status = 'FAILED') AS failed
+   FROM break_queue
+   WHERE created_at > date('now')"""
+
+
+# Polled endpoints share one computation per window: {name: (expires_at, json bytes)}
+_RESPONSE_TTL_SECONDS = 1.0
+_responses: dict[str, tuple[float, bytes]] = {}
+_response_locks: dict[str, asyncio.Lock] = {}
+
+
+async def _cached_response(name: str, build) -> Response:
+    """JSON response for build()'s result, recomputed at most once per _RESPONSE_TTL_SECONDS.
+
+    The serialized bytes are cached, so hits skip both the work and the encoding.
+    Concurrent callers that miss wait on the same lock and reuse the fresh value.
+    """
+    hit = _responses.get(name)
+    if not hit or time.monotonic() >= hit[0]:
+        async with _response_locks.setdefault(name, asyncio.Lock()):
+            hit = _responses.get(name)
+            if not hit or time.monotonic() >= hit[0]:
+                hit = (time.monotonic() + _RESPONSE_TTL_SECONDS, orjson.dumps(await build()))
+                _responses[name] = hit
+    return Response(hit[1], media_type="application/json")
+
+
 @router.get("/api/health")
 async def health():
     """Public health endpoint."""
-    db = await get_db()
-    uptime = int(time.time() - _start_time)
+    return await _cached_response("health", _build_health)
 
-    # Feed health
-    cursor = await db.execute(
-        "SELECT status, COUNT(*) as cnt FROM feed_health GROUP BY status"
-    )
-    feed_stats = {row["status"]: row["cnt"] for row in await cursor.fetchall()}
 
-    # Last break
-    cursor = await db.execute(
-        """SELECT id, type, host_id, played_at, degradation_level
-           FROM break_queue WHERE status = 'PLAYED'
-           ORDER BY played_at DESC LIMIT 1"""
-    )
-    last_break = None
-    row = await cursor.fetchone()
-    if row:
-        last_break = {
-            "id": row["id"],
-            "type": row["type"],
-            "host": row["host_id"],
-            "played_at": row["played_at"],
-            "degradation_level": row["degradation_level"],
-        }
-
-    # Stats today
-    cursor = await db.execute(
-        """SELECT
-            SUM(CASE WHEN status = 'PLAYED' THEN 1 ELSE 0 END) as played,
-            SUM(CASE WHEN status = 'FAILED' THEN 1 ELSE 0 END) as failed
-           FROM break_queue
-           WHERE created_at > date('now')"""
+async def _build_health() -> dict:
+    uptime = int(time.time() - _start_time)
+
+    # One SQLite round-trip, overlapped with the settings snapshot
+    row, settings = await asyncio.gather(
+        read_one(_HEALTH_SQL),
+        settings_cache.get_settings_cached(),
     )
-    stats_row = await cursor.fetchone()
+    feed_stats = orjson.loads(row["feed_stats"])
+    last_break = orjson.loads(row["last_break"]) if row["last_break"] else None
 
     # Scheduler info
     sched_status = scheduler.status()
 
     # Break interval
-    cursor = await db.execute(
-        "SELECT value FROM settings WHERE key = 'break_interval_minutes'"
-    )
-    interval_row = await cursor.fetchone()
-    interval = int(interval_row["value"]) if interval_row else 15
+    interval = int(settings.get("break_interval_minutes", 15))
 
     return {
         "status": "ok",
@@ -86,8 +104,8 @@ async def health():
         },
         "last_break": last_break,
         "stats_today": {
-            "breaks_played": (stats_row["played"] or 0) if stats_row else 0,
-            "breaks_failed": (stats_row["failed"] or 0) if stats_row else 0,
+            "breaks_played": row["played"],
+            "breaks_failed": row["failed"],
         },
     }
 
@@ -95,18 +113,16 @@ async def health():
 @router.get("/api/status/current")
 async def current_status():
     """Current scheduler status for admin."""
-    db = await get_db()
+    return await _cached_response("current", _build_current_status)
 
-    cursor = await db.execute(
-        "SELECT value FROM settings WHERE key = 'quiet_mode'"
-    )
-    row = await cursor.fetchone()
-    quiet = row["value"] == "true" if row else False
 
-    cursor = await db.execute(
-        "SELECT id, status FROM break_queue WHERE status IN ('PREPARING', 'READY') ORDER BY created_at DESC LIMIT 1"
+async def _build_current_status() -> dict:
+    settings = await settings_cache.get_settings_cached()
+    quiet = settings.get("quiet_mode") == "true"
+
+    bq = await read_one(
+        "SELECT id, status FROM break_queue WHERE status IN ('PREPARING', 'READY') ORDER BY created_at DESC LIMIT 1",
     )
-    bq = await cursor.fetchone()
 
     sched = scheduler.status()
 
@@ -119,16 +135,22 @@ async def current_status():
     }
 
 
+_SET_SCHEDULER_ENABLED = """INSERT INTO settings (key, value, updated_at)
+   VALUES ('scheduler_enabled', ?, datetime('now'))
+   ON CONFLICT(key) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at"""
+
+
 @router.post("/api/scheduler/start")
 async def scheduler_start(_=Depends(require_api_key)):
     """Start the scheduler and persist the setting."""
     if scheduler.is_running:
         return {"status": "already_running"}
     db = await get_db()
-    await db.execute("INSERT OR IGNORE INTO settings (key, value) VALUES ('scheduler_enabled', 'true')")
-    await db.execute("UPDATE settings SET value = 'true', updated_at = datetime('now') WHERE key = 'scheduler_enabled'")
+    await db.execute(_SET_SCHEDULER_ENABLED, ("true",))
     await db.commit()
+    settings_cache.invalidate()
     scheduler.start()
+    _responses.clear()
     return {"status": "started"}
 
 
@@ -138,67 +160,77 @@ async def scheduler_stop(_=Depends(require_api_key)):
     if not scheduler.is_running:
         return {"status": "already_stopped"}
     db = await get_db()
-    await db.execute("INSERT OR IGNORE INTO settings (key, value) VALUES ('scheduler_enabled', 'false')")
-    await db.execute("UPDATE settings SET value = 'false', updated_at = datetime('now') WHERE key = 'scheduler_enabled'")
+    await db.execute(_SET_SCHEDULER_ENABLED, ("false",))
     await db.commit()
+    settings_cache.invalidate()
     await scheduler.stop()
+    _responses.clear()
     return {"status": "stopped"}
 
 
 # --- HTMX Partials for Dashboard ---
 
+def _render_partial(request: Request, name: str, context: dict, state: tuple) -> Response:
+    """Render a polled partial, or 304 if the browser already holds this state.
+
+    `state` is everything the template output depends on; the ETag is its hash.
+    no-cache makes the browser revalidate each poll and hand HTMX its cached copy on 304.
+    """
+    etag = f'"{hashlib.blake2b(repr(state).encode(), digest_size=8).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    response = render(name, context)
+    response.headers.update(headers)
+    return response
+
+
 @router.get("/api/partials/dashboard-stats", response_class=HTMLResponse)
 async def partial_dashboard_stats(request: Request, _=Depends(require_api_key)):
-    db = await get_db()
+    stats = await read_one(_STATS_TODAY_SQL)
 
-    cursor = await db.execute(
-        """SELECT
-            SUM(CASE WHEN status='PLAYED' THEN 1 ELSE 0 END) as played,
-            SUM(CASE WHEN status='FAILED' THEN 1 ELSE 0 END) as failed
-           FROM break_queue WHERE created_at > date('now')"""
-    )
-    stats = await cursor.fetchone()
-
-    cursor = await db.execute("SELECT key, value FROM settings WHERE key = 'quiet_mode'")
-    qm = await cursor.fetchone()
+    settings = await settings_cache.get_settings_cached()
 
     sched = scheduler.status()
 
-    return templates.TemplateResponse("partials/dashboard_stats.html", {
-        "request": request,
+    context = {
         "scheduler_running": sched["running"],
         "breaks_played": (stats["played"] or 0) if stats else 0,
         "breaks_failed": (stats["failed"] or 0) if stats else 0,
-        "quiet_mode": qm["value"] == "true" if qm else False,
-    })
+        "quiet_mode": settings.get("quiet_mode") == "true",
+    }
+    return _render_partial(
+        request, "partials/dashboard_stats.html", context, tuple(context.values()),
+    )
 
 
 @router.get("/api/partials/feed-health", response_class=HTMLResponse)
 async def partial_feed_health(request: Request, _=Depends(require_api_key)):
-    db = await get_db()
-    cursor = await db.execute(
+    rows = await read_all(
         "SELECT status, COUNT(*) as cnt FROM feed_health GROUP BY status"
     )
-    feed_health = {r["status"]: r["cnt"] for r in await cursor.fetchall()}
-    return templates.TemplateResponse("partials/health_badges.html", {
-        "request": request,
-        "feed_health": feed_health,
-    })
+    feed_health = {r["status"]: r["cnt"] for r in rows}
+    return _render_partial(
+        request, "partials/health_badges.html", {"feed_health": feed_health},
+        tuple(feed_health.items()),
+    )
+
+
+# Just the columns the last-break card renders
+_LAST_BREAK_CARD_SQL = """SELECT host_id, type, degradation_level, played_at, script_text
+   FROM break_queue WHERE status = 'PLAYED'
+   ORDER BY played_at DESC LIMIT 1"""
 
 
 @router.get("/api/partials/last-break", response_class=HTMLResponse)
 async def partial_last_break(request: Request, _=Depends(require_api_key)):
-    db = await get_db()
-    cursor = await db.execute(
-        "SELECT * FROM break_queue WHERE status='PLAYED' ORDER BY played_at DESC LIMIT 1"
+    last_break, host_names = await asyncio.gather(
+        read_one(_LAST_BREAK_CARD_SQL),
+        hosts_cache.get_host_names(),
     )
-    last_break = await cursor.fetchone()
-
-    cursor = await db.execute("SELECT id, label FROM hosts")
-    host_names = {r["id"]: r["label"] for r in await cursor.fetchall()}
 
-    return templates.TemplateResponse("partials/last_break.html", {
-        "request": request,
-        "last_break": dict(last_break) if last_break else None,
+    state = (tuple(last_break), host_names.get(last_break["host_id"])) if last_break else ()
+    return _render_partial(request, "partials/last_break.html", {
+        "last_break": last_break,
         "host_names": host_names,
-    })
+    }, state)
@@ -1,19 +1,25 @@
 """Break builder — orchestrates the full break generation pipeline."""
 
-import json
+import asyncio
 import time
-from datetime import datetime, timezone
 
 from core.config import BREAKS_DIR, HLS_VIDEO_DIR
-from core.database import get_db
+from core.log import get_logger
 from core.providers import weather, news, llm, tts_router, bitcoin
 from core.services import (
     break_queue,
     content_filter,
     host_rotation,
     degradation,
+    event_log,
+    settings_cache,
 )
 
+log = get_logger("builder")
+
+# IDs of breaks this process is building right now
+_preparing: set[str] = set()
+
 
 async def prepare_break(is_breaking: bool = False, breaking_note: str = ""):
     """
@@ -27,32 +33,43 @@ async def prepare_break(is_breaking: bool = False, breaking_note: str = ""):
     7. Video render + HLS
     8. Mark ready
     """
-    t0 = time.time()
-    now = datetime.now(timezone.utc)
-    break_id = f"brk_{now.strftime('%Y%m%d_%H%M%S')}_{now.strftime('%f')[:4]}"
-    deg_level = 0
+    # Check if already preparing (in-process; startup fails any stale PREPARING rows)
+    if _preparing and not is_breaking:
+        log.info(f"Already preparing {next(iter(_preparing))}, skipping")
+        return
 
-    db = await get_db()
+    t0 = time.time()
+    # brk_<UTC YYYYmmdd_HHMMSS>_<4 sub-second digits>, derived from t0
+    break_id = f"brk_{time.strftime('%Y%m%d_%H%M%S', time.gmtime(t0))}_{int(t0 * 10000) % 10000:04d}"
+    _preparing.add(break_id)
+    try:
+        await _build_break(break_id, t0, is_breaking)
+    finally:
+        _preparing.discard(break_id)
 
-    # Get settings
-    settings = {}
-    cursor = await db.execute("SELECT key, value FROM settings")
-    for row in await cursor.fetchall():
-        settings[row["key"]] = row["value"]
 
-    # Check if already preparing
-    existing = await break_queue.get_preparing_break()
-    if existing and not is_breaking:
-        print(f"[builder] Already preparing {existing['id']}, skipping")
-        return
+async def _build_break(break_id: str, t0: float, is_breaking: bool):
+    deg_level = 0
 
     try:
-        # Pick host
-        host = await host_rotation.get_next_host(is_breaking)
+        settings, host = await asyncio.gather(
+            settings_cache.get_settings_cached(),
+            host_rotation.get_next_host(is_breaking),
+        )
         if not host:
-            print("[builder] No host available")
+            log.warning("No host available")
             return
 
+        # 1. Weather + Bitcoin + news feeds (independent network I/O), overlapping the
+        #    queue insert below. Never cancelled: fetch_all_feeds writes through the
+        #    shared connection and must reach its own commit.
+        fetches = asyncio.gather(
+            weather.get_weather_for_cities(),
+            bitcoin.get_bitcoin_data(),
+            news.fetch_all_feeds(),
+            return_exceptions=True,
+        )
+
         await break_queue.create_break(
             break_id,
             break_type="breaking" if is_breaking else "scheduled",
@@ -60,24 +77,19 @@ async def prepare_break(is_breaking: bool = False, breaking_note: str = ""):
             host_id=host["id"],
         )
 
-        # 1. Weather + Bitcoin (parallel)
-        import asyncio
-        weather_result, bitcoin_result = await asyncio.gather(
-            weather.get_weather_for_cities(),
-            bitcoin.get_bitcoin_data(),
-            return_exceptions=True,
-        )
+        weather_result, bitcoin_result, feeds_result = await fetches
         weather_data = weather_result if isinstance(weather_result, list) else []
         bitcoin_data = bitcoin_result if isinstance(bitcoin_result, dict) else None
         if isinstance(weather_result, Exception):
-            print(f"[builder] Weather error: {weather_result}")
+            log.warning(f"Weather error: {weather_result}")
         if isinstance(bitcoin_result, Exception):
-            print(f"[builder] Bitcoin error: {bitcoin_result}")
+            log.warning(f"Bitcoin error: {bitcoin_result}")
+        if isinstance(feeds_result, Exception):
+            log.warning(f"News fetch error: {feeds_result}")
 
-        # 2. News — fetch, score, select
+        # 2. News — score, select (feeds were fetched above)
         headlines = []
         try:
-            await news.fetch_all_feeds()
             unscored = await news.get_recent_unscored(limit=20)
 
             if unscored:
@@ -85,18 +97,17 @@ async def prepare_break(is_breaking: bool = False, breaking_note: str = ""):
                     [{"title": h["title"], "source": h.get("source_id", "")} for h in unscored]
                 )
 
-                for s in scores:
-                    idx = s.get("index", -1)
-                    if 0 <= idx < len(unscored):
-                        await news.mark_scored(
-                            unscored[idx]["id"],
-                            s.get("score", 0),
-                            s.get("category"),
-                        )
+                await news.mark_scored_batch([
+                    (unscored[idx]["id"], s.get("score", 0), s.get("category"))
+                    for s in scores
+                    if 0 <= (idx := s.get("index", -1)) < len(unscored)
+                ])
 
-            recently_used_ids = await break_queue.get_recent_headline_ids(lookback=2)
+            # One query for the last 10 breaks; the last 2 are excluded outright
+            used = await break_queue.get_recent_headline_id_lists(lookback=10)
+            recently_used_ids = [i for ids in used[:2] for i in ids]
             # Wider lookback for "previously reported" tagging
-            all_used_ids = set(await break_queue.get_recent_headline_ids(lookback=10))
+            all_used_ids = {i for ids in used for i in ids}
             dedupe_window = int(settings.get("news_dedupe_window_minutes", "60"))
             headlines = await news.get_top_headlines(
                 limit=3,
@@ -107,7 +118,7 @@ async def prepare_break(is_breaking: bool = False, breaking_note: str = ""):
             for h in headlines:
                 h["previously_reported"] = h["id"] in all_used_ids
         except Exception as e:
-            print(f"[builder] News pipeline error: {e}")
+            log.warning(f"News pipeline error: {e}")
 
         # 3. Generate script
         master_prompt = settings.get("master_prompt", "You are a TV news anchor.")
@@ -117,10 +128,11 @@ async def prepare_break(is_breaking: bool = False, breaking_note: str = ""):
         else:
             s_min_w = int(settings.get("break_min_words", "15"))
             s_max_w = int(settings.get("break_max_words", "100"))
-            # More room for bitcoin market segment
-            if bitcoin_data:
-                s_max_w = max(s_max_w, 180)
-        s_max_c = int(settings.get("break_max_chars", "1200" if bitcoin_data else "600"))
+        s_max_c = int(settings.get("break_max_chars", "600"))
+        # More room for bitcoin market segment (the seeded 600-char setting would reject it)
+        if bitcoin_data and not is_breaking:
+            s_max_w = max(s_max_w, 180)
+            s_max_c = max(s_max_c, 1200)
 
         script = await llm.generate_break_script(
             weather_data, headlines, host, master_prompt, is_breaking,
@@ -130,12 +142,12 @@ async def prepare_break(is_breaking: bool = False, breaking_note: str = ""):
 
         # 4. Fallback if LLM failed
         if not script:
-            print("[builder] LLM failed, trying fallback")
+            log.warning("LLM failed, trying fallback")
             script, deg_level = await degradation.get_fallback_script(weather_data)
 
             if script is None:
                 await break_queue.mark_failed(break_id, "all fallbacks exhausted")
-                await _log_break(break_id, t0, 4, error="all_fallbacks_failed")
+                _log_break(break_id, t0, 4, error="all_fallbacks_failed")
                 return
 
         # 5. Content filter
@@ -144,11 +156,11 @@ async def prepare_break(is_breaking: bool = False, breaking_note: str = ""):
             min_words=s_min_w, max_words=s_max_w, max_chars=s_max_c,
         )
         if not valid:
-            print(f"[builder] Content filter rejected: {reason}")
+            log.warning(f"Content filter rejected: {reason}")
             script, deg_level = await degradation.get_fallback_script(weather_data)
             if script is None:
                 await break_queue.mark_failed(break_id, f"filter: {reason}")
-                await _log_break(break_id, t0, deg_level, error=reason)
+                _log_break(break_id, t0, deg_level, error=reason)
                 return
 
         # 6. TTS + optional dialog mode
@@ -173,9 +185,9 @@ async def prepare_break(is_breaking: bool = False, breaking_note: str = ""):
             audio_path = await tts_router.synthesize(script, host, break_id)
 
         if not audio_path:
-            print("[builder] TTS failed")
+            log.warning("TTS failed")
             await break_queue.mark_failed(break_id, "TTS failed")
-            await _log_break(break_id, t0, 4, error="tts_failed")
+            _log_break(break_id, t0, 4, error="tts_failed")
             return
 
         # 7. Video render (always enabled for TV)
@@ -190,7 +202,7 @@ async def prepare_break(is_breaking: bool = False, breaking_note: str = ""):
         if video_path:
             hls_video_path = await _convert_to_hls(video_path, break_id)
 
-        # 8. Mark ready
+        # 8. Mark ready + played
         elapsed_ms = int((time.time() - t0) * 1000)
         await break_queue.mark_ready(
             break_id,
@@ -207,18 +219,17 @@ async def prepare_break(is_breaking: bool = False, breaking_note: str = ""):
                 "video_path": video_path,
                 "hls_video_path": hls_video_path,
             },
+            # Straight to PLAYED: TV has no separate playout step
+            played=True,
         )
 
-        # Mark as PLAYED (TV has no separate playout step)
-        await break_queue.mark_played(break_id)
-
-        await _log_break(break_id, t0, deg_level)
-        print(f"[builder] Break {break_id} ready in {elapsed_ms}ms (deg={deg_level})")
+        _log_break(break_id, t0, deg_level)
+        log.info(f"Break {break_id} ready in {elapsed_ms}ms (deg={deg_level})")
 
     except Exception as e:
-        print(f"[builder] Pipeline error: {e}")
+        log.error(f"Pipeline error: {e}")
         await break_queue.mark_failed(break_id, str(e))
-        await _log_break(break_id, t0, 4, error=str(e))
+        _log_break(break_id, t0, 4, error=str(e))
 
 
 async def _render_video(
@@ -226,7 +237,6 @@ async def _render_video(
 ) -> str | None:
     """Render video for a break in a thread (FFmpeg is blocking)."""
     try:
-        import asyncio
         from functools import partial
         from visual.bridge import render_break_video
 
@@ -243,14 +253,13 @@ async def _render_video(
         )
         return result
     except Exception as e:
-        print(f"[builder] Video render failed (non-fatal): {e}")
+        log.warning(f"Video render failed (non-fatal): {e}")
         return None
 
 
 async def _synthesize_dialog(dialog_script: dict, break_id: str) -> str | None:
     """Synthesize TTS for each dialog line and combine into one MP3."""
     try:
-        import asyncio
         import tempfile
         from functools import partial
         from visual.bridge import synthesize_dialog
@@ -281,22 +290,22 @@ async def _synthesize_dialog(dialog_script: dict, break_id: str) -> str | None:
         concat_file = Path(audio_dir) / "concat.txt"
         concat_file.write_text("\n".join(f"file '{f}'" for f in audio_files))
 
-        run_ffmpeg([
+        # Blocking ffmpeg call — keep it off the event loop
+        await loop.run_in_executor(None, partial(run_ffmpeg, [
             "-f", "concat", "-safe", "0", "-i", str(concat_file),
             "-c", "copy",
             str(combined_path),
-        ], desc=f"combine dialog audio ({len(audio_files)} files)")
+        ], desc=f"combine dialog audio ({len(audio_files)} files)"))
 
         return combined_path
     except Exception as e:
-        print(f"[builder] Dialog TTS failed (non-fatal): {e}")
+        log.warning(f"Dialog TTS failed (non-fatal): {e}")
         return None
 
 
 async def _render_dialog_video(dialog_script: dict, break_id: str) -> str | None:
     """Render video for a dialog script in a thread."""
     try:
-        import asyncio
         from functools import partial
         from visual.bridge import render_dialog_video
 
@@ -312,14 +321,13 @@ async def _render_dialog_video(dialog_script: dict, break_id: str) -> str | None
         )
         return result
     except Exception as e:
-        print(f"[builder] Dialog video render failed (non-fatal): {e}")
+        log.warning(f"Dialog video render failed (non-fatal): {e}")
         return None
 
 
 async def _convert_to_hls(video_path: str, break_id: str) -> str | None:
     """Convert MP4 to HLS segments (remux, no re-encode)."""
     try:
-        import asyncio
         import subprocess
         from pathlib import Path
 
@@ -341,16 +349,16 @@ async def _convert_to_hls(video_path: str, break_id: str) -> str | None:
         ))
 
         if result.returncode != 0:
-            print(f"[builder] HLS conversion failed: {result.stderr.decode()[-200:]}")
+            log.warning(f"HLS conversion failed: {result.stderr.decode()[-200:]}")
             return None
 
         # Cleanup old HLS dirs (keep last 5)
         _cleanup_old_hls()
 
-        print(f"[builder] HLS segments created: {hls_dir}")
+        log.info(f"HLS segments created: {hls_dir}")
         return str(playlist)
     except Exception as e:
-        print(f"[builder] HLS conversion failed (non-fatal): {e}")
+        log.warning(f"HLS conversion failed (non-fatal): {e}")
         return None
 
 
@@ -368,18 +376,13 @@ def _cleanup_old_hls(keep: int = 5):
         for d in dirs[keep:]:
             shutil.rmtree(d, ignore_errors=True)
     except Exception as e:
-        print(f"[builder] HLS cleanup error: {e}")
+        log.warning(f"HLS cleanup error: {e}")
 
 
-async def _log_break(break_id: str, t0: float, deg_level: int, error: str = ""):
+def _log_break(break_id: str, t0: float, deg_level: int, error: str = ""):
     elapsed_ms = int((time.time() - t0) * 1000)
-    db = await get_db()
     event_type = "break_failed" if error else "break_ready"
     payload = {"break_id": break_id, "degradation_level": deg_level}
     if error:
         payload["error"] = error
-    await db.execute(
-        "INSERT INTO events_log (event_type, payload_json, latency_ms) VALUES (?, ?, ?)",
-        (event_type, json.dumps(payload), elapsed_ms),
-    )
-    await db.commit()
+    event_log.log_event(event_type, payload, elapsed_ms)
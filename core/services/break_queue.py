@@ -1,11 +1,17 @@
 """Break queue — CRUD operations on break_queue table."""
 
-import json
 from datetime import datetime, timezone
 
+import orjson
+
 from core.database import get_db
 
 
+def _now_iso() -> str:
+    """Current UTC time as ISO 8601 (the format every break_queue timestamp uses)."""
+    return datetime.now(timezone.utc).isoformat()
+
+
 async def create_break(
     break_id: str,
     break_type: str = "scheduled",
@@ -30,58 +36,44 @@ async def mark_ready(
     degradation_level: int = 0,
     duration_ms: int | None = None,
     meta: dict | None = None,
+    played: bool = False,
 ):
-    """Mark break as ready."""
+    """Mark break as ready, or straight to PLAYED (same statement, one commit)."""
     db = await get_db()
-    now = datetime.now(timezone.utc).isoformat()
+    now = _now_iso()
     await db.execute(
         """UPDATE break_queue
-           SET status = 'READY', script_text = ?, audio_path = ?,
+           SET status = ?, script_text = ?, audio_path = ?,
                degradation_level = ?, ready_at = ?, duration_ms = ?,
-               meta_json = ?
+               meta_json = ?, played_at = ?
            WHERE id = ?""",
         (
+            "PLAYED" if played else "READY",
             script_text,
             audio_path,
             degradation_level,
             now,
             duration_ms,
-            json.dumps(meta) if meta else None,
+            orjson.dumps(meta).decode() if meta else None,
+            now if played else None,
             break_id,
         ),
     )
     await db.commit()
 
 
-async def mark_played(break_id: str):
-    """Mark break as played."""
-    db = await get_db()
-    now = datetime.now(timezone.utc).isoformat()
-    await db.execute(
-        "UPDATE break_queue SET status = 'PLAYED', played_at = ? WHERE id = ?",
-        (now, break_id),
-    )
-    await db.commit()
-
-
 async def mark_failed(break_id: str, reason: str = ""):
     """Mark break as failed, preserving existing metadata."""
     db = await get_db()
-    # Merge error into existing meta instead of overwriting
-    cursor = await db.execute(
-        "SELECT meta_json FROM break_queue WHERE id = ?", (break_id,)
-    )
-    row = await cursor.fetchone()
-    meta = {}
-    if row and row["meta_json"]:
-        try:
-            meta = json.loads(row["meta_json"])
-        except (json.JSONDecodeError, TypeError):
-            pass
-    meta["error"] = reason
+    # Merge error into existing meta instead of overwriting (unreadable meta starts fresh)
     await db.execute(
-        "UPDATE break_queue SET status = 'FAILED', meta_json = ? WHERE id = ?",
-        (json.dumps(meta), break_id),
+        """UPDATE break_queue
+           SET status = 'FAILED',
+               meta_json = json_set(
+                   CASE WHEN json_valid(meta_json) THEN meta_json ELSE '{}' END,
+                   '$.error', ?)
+           WHERE id = ?""",
+        (reason, break_id),
     )
     await db.commit()
 
@@ -99,8 +91,11 @@ async def get_ready_break() -> dict | None:
     return dict(row) if row else None
 
 
-async def get_recent_headline_ids(lookback: int = 2) -> list[str]:
-    """Get headline IDs used in the last N played/ready breaks."""
+async def get_recent_headline_id_lists(lookback: int = 2) -> list[list[str]]:
+    """Headline IDs of the last N played/ready breaks, one list per break, newest first.
+
+    Callers that need several lookbacks slice one result instead of re-querying.
+    """
     db = await get_db()
     cursor = await db.execute(
         """SELECT meta_json FROM break_queue
@@ -109,21 +104,11 @@ async def get_recent_headline_ids(lookback: int = 2) -> list[str]:
            ORDER BY created_at DESC LIMIT ?""",
         (lookback,),
     )
-    ids = []
+    per_break = []
     for row in await cursor.fetchall():
         try:
-            meta = json.loads(row["meta_json"])
-            ids.extend(meta.get("headline_ids", []))
-        except (json.JSONDecodeError, TypeError):
-            pass
-    return ids
-
-
-async def get_preparing_break() -> dict | None:
-    """Check if there's a break currently being prepared."""
-    db = await get_db()
-    cursor = await db.execute(
-        "SELECT * FROM break_queue WHERE status = 'PREPARING' LIMIT 1"
-    )
-    row = await cursor.fetchone()
-    return dict(row) if row else None
+            meta = orjson.loads(row["meta_json"])
+            per_break.append(meta.get("headline_ids", []))
+        except (orjson.JSONDecodeError, TypeError):
+            per_break.append([])
+    return per_break
@@ -1,8 +1,11 @@
 """Sync character DB row → filesystem config.json for visual pipeline."""
 
 import json
+import os
 from pathlib import Path
 
+import orjson
+
 from core.config import ASSETS_DIR
 
 
@@ -33,4 +36,15 @@ def sync_character_config(char_id: str, row: dict):
     }
 
     config_path = char_dir / "config.json"
-    config_path.write_text(json.dumps(config, indent=2))
+    # Keep indentation: config.json files are also hand-edited in assets/
+    data = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    try:
+        if config_path.read_bytes() == data:
+            return  # unchanged — leave mtime alone
+    except FileNotFoundError:
+        pass
+
+    # Write to a temp file and swap it in so AssetPack never reads a half-written file
+    tmp_path = config_path.with_suffix(".json.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, config_path)
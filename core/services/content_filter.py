@@ -14,6 +14,17 @@ BLOCKED_SUBSTRINGS = [
     "http", "www.", ".com", ".org", ".net",
 ]
 
+
+def _phrase_re(phrases: list[str]) -> re.Pattern:
+    """One word-bounded alternation for all phrases, longest first (matched against lowercased text)."""
+    alts = "|".join(re.escape(p) for p in sorted(phrases, key=len, reverse=True))
+    return re.compile(rf"\b(?:{alts})\b")
+
+
+# Compiled once; breaking scripts may say "breaking news"
+_PHRASES_RE = _phrase_re(BLOCKED_PHRASES)
+_BREAKING_PHRASES_RE = _phrase_re([p for p in BLOCKED_PHRASES if p != "breaking news"])
+
 DEFAULT_MIN_WORDS = 15
 DEFAULT_MAX_WORDS = 100
 DEFAULT_MAX_CHARS = 600
@@ -35,8 +46,6 @@ def validate(
     if not script or not script.strip():
         return False, "empty script"
 
-    words = script.split()
-
     if is_breaking:
         min_w = min_words if min_words is not None else DEFAULT_BREAKING_MIN_WORDS
         max_w = max_words if max_words is not None else DEFAULT_BREAKING_MAX_WORDS
@@ -46,25 +55,26 @@ def validate(
 
     max_c = max_chars if max_chars is not None else DEFAULT_MAX_CHARS
 
+    # O(1) check first — an oversized script is rejected before it is tokenized
+    if len(script) > max_c:
+        return False, f"exceeds {max_c} chars"
+
+    words = script.split()
+
     if len(words) < min_w:
         return False, f"too short ({len(words)} words, min {min_w})"
 
     if len(words) > max_w:
         return False, f"too long ({len(words)} words, max {max_w})"
 
-    if len(script) > max_c:
-        return False, f"exceeds {max_c} chars"
-
+    # Lowercase once, only after the length checks pass; a case-sensitive scan of the
+    # lowered text is ~3x faster than an IGNORECASE scan of the original
     lower = script.lower()
 
     # Word-boundary matching for phrases (won't match "investigation" for "invest")
-    phrases = BLOCKED_PHRASES.copy()
-    if is_breaking:
-        phrases = [w for w in phrases if w != "breaking news"]
-
-    for phrase in phrases:
-        if re.search(r'\b' + re.escape(phrase) + r'\b', lower):
-            return False, f"blocked word: '{phrase}'"
+    match = (_BREAKING_PHRASES_RE if is_breaking else _PHRASES_RE).search(lower)
+    if match:
+        return False, f"blocked word: '{match.group(0)}'"
 
     # Substring matching for URLs/domains
     for sub in BLOCKED_SUBSTRINGS:
@@ -0,0 +1,51 @@
+"""Event log writer — queues events_log rows and inserts them in batches."""
+
+import asyncio
+
+import orjson
+
+from core.database import get_db
+from core.log import get_logger
+
+log = get_logger("events")
+
+FLUSH_INTERVAL_SECONDS = 0.2
+
+_INSERT = "INSERT INTO events_log (event_type, payload_json, latency_ms) VALUES (?, ?, ?)"
+
+_pending: list[tuple[str, str, int | None]] = []
+_flusher: asyncio.Task | None = None
+
+
+def log_event(event_type: str, payload: dict, latency_ms: int | None = None):
+    """Queue an events_log row; it is written within FLUSH_INTERVAL_SECONDS."""
+    global _flusher
+    _pending.append((event_type, orjson.dumps(payload).decode(), latency_ms))
+    if _flusher is None or _flusher.done():
+        _flusher = asyncio.get_running_loop().create_task(_flush_later())
+
+
+async def _flush_later():
+    await asyncio.sleep(FLUSH_INTERVAL_SECONDS)
+    await flush()
+
+
+async def flush():
+    """Write every queued row in one transaction (one commit, one fsync)."""
+    if not _pending:
+        return
+    rows = _pending[:]
+    _pending.clear()
+    try:
+        db = await get_db()
+        await db.executemany(_INSERT, rows)
+        await db.commit()
+    except Exception as e:
+        log.warning(f"Failed to write {len(rows)} event(s): {e}")
+
+
+async def close():
+    """Cancel the pending timer and write what's left. Call before close_db()."""
+    if _flusher and not _flusher.done():
+        _flusher.cancel()
+    await flush()
@@ -0,0 +1,26 @@
+"""Host names cache — {host_id: label}, re-read only after a host is edited."""
+
+from core.database import read_all
+
+# Bumped by invalidate(); a read that raced with an edit is not stored
+_version = 0
+_cached: tuple[int, dict[str, str]] = (-1, {})
+
+
+async def get_host_names() -> dict[str, str]:
+    """{id: label} for every host. Shared dict — callers must not mutate it."""
+    global _cached
+    version = _version
+    if _cached[0] == version:
+        return _cached[1]
+    rows = await read_all("SELECT id, label FROM hosts")
+    names = {r["id"]: r["label"] for r in rows}
+    if version == _version:
+        _cached = (version, names)
+    return names
+
+
+def invalidate():
+    """Call after committing any write to the hosts table."""
+    global _version
+    _version += 1
@@ -3,7 +3,10 @@
 import asyncio
 from datetime import datetime, timezone
 
-from core.database import get_db
+from core.log import get_logger
+from core.services import settings_cache
+
+log = get_logger("scheduler")
 
 
 class BreakScheduler:
@@ -29,32 +32,25 @@ class BreakScheduler:
     def next_trigger(self) -> datetime | None:
         return self._next_trigger
 
+    # Both read the shared settings snapshot; the settings endpoints invalidate it on write
     async def _get_interval_minutes(self) -> int:
         try:
-            db = await get_db()
-            cursor = await db.execute(
-                "SELECT value FROM settings WHERE key = 'break_interval_minutes'"
-            )
-            row = await cursor.fetchone()
-            if row:
-                return max(1, int(row["value"]))
+            settings = await settings_cache.get_settings_cached()
+            if "break_interval_minutes" in settings:
+                return max(1, int(settings["break_interval_minutes"]))
         except Exception:
             pass
         return 15
 
     async def _is_quiet_mode(self) -> bool:
         try:
-            db = await get_db()
-            cursor = await db.execute(
-                "SELECT value FROM settings WHERE key = 'quiet_mode'"
-            )
-            row = await cursor.fetchone()
-            return row["value"] == "true" if row else False
+            settings = await settings_cache.get_settings_cached()
+            return settings.get("quiet_mode") == "true"
         except Exception:
             return False
 
     async def _loop(self):
-        print("[scheduler] Started")
+        log.info("Started")
         first_run = True
         while self._running:
             try:
@@ -63,7 +59,7 @@ class BreakScheduler:
                 if first_run:
                     # Fire immediately on start, don't wait
                     first_run = False
-                    print("[scheduler] First run — triggering immediately")
+                    log.info("First run — triggering immediately")
                 else:
                     self._next_trigger = datetime.now(timezone.utc)
                     await asyncio.sleep(interval * 60)
@@ -73,24 +69,24 @@ class BreakScheduler:
 
                 # Check quiet mode
                 if await self._is_quiet_mode():
-                    print("[scheduler] Quiet mode active, skipping break")
+                    log.info("Quiet mode active, skipping break")
                     continue
 
                 # Trigger break generation
                 if self._prepare_break_fn:
                     self._last_trigger = datetime.now(timezone.utc)
-                    print("[scheduler] Triggering break generation")
+                    log.info("Triggering break generation")
                     asyncio.create_task(self._prepare_break_fn())
                 else:
-                    print("[scheduler] No prepare_break function set")
+                    log.warning("No prepare_break function set")
 
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                print(f"[scheduler] Error: {e}")
+                log.warning(f"Error: {e}")
                 await asyncio.sleep(30)
 
-        print("[scheduler] Stopped")
+        log.info("Stopped")
 
     def start(self):
         if self._running:
@@ -0,0 +1,39 @@
+"""Settings cache — in-process snapshot of the settings table with a short TTL."""
+
+import asyncio
+import time
+
+from core.database import read_all
+
+SETTINGS_TTL_SECONDS = 5.0
+
+_settings: dict[str, str] = {}
+_expires_at = 0.0
+_lock = asyncio.Lock()
+# Bumped by invalidate(); a refresh that raced with a write is not stored
+_version = 0
+
+
+async def get_settings_cached(ttl: float = SETTINGS_TTL_SECONDS) -> dict[str, str]:
+    """All settings as {key: value}. Shared snapshot — callers must not mutate it."""
+    global _settings, _expires_at
+    if time.monotonic() < _expires_at:
+        return _settings
+    async with _lock:
+        # Another request may have refreshed while we waited
+        if time.monotonic() < _expires_at:
+            return _settings
+        version = _version
+        rows = await read_all("SELECT key, value FROM settings")
+        settings = {r["key"]: r["value"] for r in rows}
+        if version == _version:
+            _settings = settings
+            _expires_at = time.monotonic() + ttl
+    return settings
+
+
+def invalidate():
+    """Drop the snapshot; call after committing any settings write."""
+    global _expires_at, _version
+    _version += 1
+    _expires_at = 0.0
@@ -0,0 +1,30 @@
+"""Shared Jinja2 templates — one environment for every router, compiled once."""
+
+from pathlib import Path
+
+from fastapi.responses import HTMLResponse
+from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+from core.config import BASE_PATH
+
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+
+templates = Jinja2Templates(env=Environment(
+    loader=FileSystemLoader(str(TEMPLATES_DIR)),
+    autoescape=True,
+    auto_reload=False,
+    bytecode_cache=FileSystemBytecodeCache(),
+))
+templates.env.globals["base"] = BASE_PATH
+
+# Compile every template once at import instead of on first request
+_COMPILED = {
+    name: templates.env.get_template(name)
+    for name in (p.relative_to(TEMPLATES_DIR).as_posix() for p in TEMPLATES_DIR.rglob("*.html"))
+}
+
+
+def render(name: str, context: dict) -> HTMLResponse:
+    """Render a precompiled template to an HTMLResponse."""
+    return HTMLResponse(_COMPILED[name].render(context))
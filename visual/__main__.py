@@ -13,8 +13,11 @@ import tempfile
 import time
 from pathlib import Path
 
+from core.log import get_logger
 from visual.config import DEFAULT_ASSETS_DIR, DEFAULT_OUTPUT_DIR, FPS
 
+log = get_logger("visual")
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -45,13 +48,13 @@ def main():
     from visual.script_generator import load_script, generate_script
 
     if args.script:
-        print(f"[visual] Loading script: {args.script}")
+        log.info(f"Loading script: {args.script}")
         script = load_script(args.script)
     else:
-        print(f"[visual] Generating script for: {args.topic}")
+        log.info(f"Generating script for: {args.topic}")
         script = generate_script(args.topic)
 
-    print(f"[visual] Script: '{script.title}' — {len(script.scenes)} scenes, "
+    log.info(f"Script: '{script.title}' — {len(script.scenes)} scenes, "
           f"characters: {script.characters}")
 
     # 2. Load assets
@@ -66,7 +69,7 @@ def main():
         from visual.bridge import CHARACTER_VOICE
 
         audio_dir = Path(tempfile.mkdtemp(prefix="hermes_tts_"))
-        print(f"[visual] TTS output dir: {audio_dir}")
+        log.info(f"TTS output dir: {audio_dir}")
 
         for scene in script.scenes:
             for line in scene.lines:
@@ -85,14 +88,14 @@ def main():
                 line.audio_path = audio_path
                 line.duration_ms = duration
     else:
-        print("[visual] Skipping TTS — using durations from script")
+        log.info("Skipping TTS — using durations from script")
         for scene in script.scenes:
             for line in scene.lines:
                 if line.duration_ms <= 0:
                     line.duration_ms = 3000  # default 3s per line
 
     t_tts = time.time()
-    print(f"[visual] TTS phase: {t_tts - t0:.1f}s")
+    log.info(f"TTS phase: {t_tts - t0:.1f}s")
 
     # 4. Generate EDL
     from visual.director import generate_edl
@@ -120,9 +123,9 @@ def main():
         )
 
     t_render = time.time()
-    print(f"[visual] Render phase: {t_render - t_tts:.1f}s")
-    print(f"[visual] Total: {t_render - t0:.1f}s")
-    print(f"[visual] Output: {output_path} "
+    log.info(f"Render phase: {t_render - t_tts:.1f}s")
+    log.info(f"Total: {t_render - t0:.1f}s")
+    log.info(f"Output: {output_path} "
           f"({edl.total_duration_ms / 1000:.1f}s @ {FPS}fps)")
 
 
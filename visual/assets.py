@@ -1,11 +1,14 @@
 """Asset loader — loads and validates character PNGs and backgrounds."""
 
 import json
+import logging
 from pathlib import Path
 
 from visual.config import DEFAULT_ASSETS_DIR
 from visual.models import CharacterConfig
 
+log = logging.getLogger("hermes.assets")
+
 
 class AssetPack:
     """Loaded and validated asset bundle."""
@@ -58,7 +61,7 @@ class AssetPack:
                 positions=positions,
                 states=states,
             )
-            print(f"[assets] Loaded character: {cid} "
+            log.info(f"Loaded character: {cid} "
                   f"({len(positions)} positions, {len(states)} emotions)")
 
     def _scan_emotion_states(
@@ -91,7 +94,7 @@ class AssetPack:
         for png in sorted(bg_dir.glob("*.png")):
             key = png.stem  # e.g. "studio_wide"
             self.backgrounds[key] = png
-            print(f"[assets] Loaded background: {key}")
+            log.info(f"Loaded background: {key}")
 
         if not self.backgrounds:
             raise FileNotFoundError(f"No background PNGs found in {bg_dir}")
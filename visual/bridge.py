@@ -5,19 +5,24 @@ Supports two modes:
 - Dialog: multi-character script → per-line TTS → MP4 (new, Character Engine)
 """
 
+import logging
 import os
 import sqlite3
 import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from visual.assets import AssetPack
 from visual.compositor import render_segment, concatenate_segments
-from visual.config import DEFAULT_ASSETS_DIR
+from visual.config import DEFAULT_ASSETS_DIR, TTS_LINE_WORKERS
 from visual.director import generate_edl
 from visual.ffmpeg_utils import probe_duration_ms
 from visual.models import Script, Scene, DialogLine
 
+log = logging.getLogger("hermes.visual:bridge")
+tts_log = logging.getLogger("hermes.bridge:tts")
+
 # Map host IDs to visual character IDs (fallback)
 HOST_TO_CHARACTER = {
     "host_a": "alex",   # Luna → alex
@@ -159,11 +164,11 @@ def render_break_video(
             )
 
         elapsed = time.time() - t0
-        print(f"[visual:bridge] Rendered {break_id} in {elapsed:.1f}s → {output_path}")
+        log.info(f"Rendered {break_id} in {elapsed:.1f}s → {output_path}")
         return str(output_path)
 
     except Exception as e:
-        print(f"[visual:bridge] Render failed: {e}")
+        log.warning(f"Render failed: {e}")
         return None
 
 
@@ -185,23 +190,27 @@ def synthesize_dialog(dialog_script: dict, output_dir: str) -> dict:
     out = Path(output_dir)
     out.mkdir(parents=True, exist_ok=True)
 
-    line_idx = 0
-    for scene in dialog_script.get("scenes", []):
-        for line in scene.get("lines", []):
-            char_id = line["character"]
-            voice_cfg = get_voice_config(char_id)
-
-            audio_path, duration_ms = synthesize_line(
-                text=line["text"],
-                character=char_id,
-                output_dir=str(out),
-                provider="piper",
-                model=voice_cfg["piper_model"],
-            )
-            line["audio_path"] = audio_path
-            line["duration_ms"] = duration_ms
-            line_idx += 1
-            print(f"[bridge:tts] Line {line_idx} ({char_id}): {duration_ms}ms")
+    lines = [line for scene in dialog_script.get("scenes", []) for line in scene.get("lines", [])]
+
+    def _synthesize(line_idx: int, line: dict) -> None:
+        char_id = line["character"]
+        voice_cfg = get_voice_config(char_id)
+
+        audio_path, duration_ms = synthesize_line(
+            text=line["text"],
+            character=char_id,
+            output_dir=str(out),
+            provider="piper",
+            model=voice_cfg["piper_model"],
+        )
+        line["audio_path"] = audio_path
+        line["duration_ms"] = duration_ms
+        tts_log.info(f"Line {line_idx} ({char_id}): {duration_ms}ms")
+
+    # Each line is an independent Piper + ffmpeg subprocess pair, so run a few at once.
+    # Consuming the map re-raises the first failure, as the sequential loop did.
+    with ThreadPoolExecutor(max_workers=TTS_LINE_WORKERS) as pool:
+        list(pool.map(_synthesize, range(1, len(lines) + 1), lines))
 
     return dialog_script
 
@@ -252,9 +261,9 @@ def render_dialog_video(
             )
 
         elapsed = time.time() - t0
-        print(f"[visual:bridge] Rendered dialog {break_id} in {elapsed:.1f}s → {output_path}")
+        log.info(f"Rendered dialog {break_id} in {elapsed:.1f}s → {output_path}")
         return str(output_path)
 
     except Exception as e:
-        print(f"[visual:bridge] Dialog render failed: {e}")
+        log.warning(f"Dialog render failed: {e}")
         return None
@@ -7,6 +7,7 @@ Rendering approach (no frame-by-frame Python rendering):
 4. Final concatenation: -c copy for all-cut, xfade for dissolve/fade_black
 """
 
+import logging
 import os
 import tempfile
 from pathlib import Path
@@ -22,6 +23,8 @@ from visual.config import (
 from visual.ffmpeg_utils import run_ffmpeg, get_encoder_args, detect_encoder, probe_duration_ms
 from visual.models import EDL, EDLSegment
 
+log = logging.getLogger("hermes.compositor")
+
 # Module-level encoder (detected once)
 _encoder: str | None = None
 
@@ -208,18 +211,17 @@ def _write_concat_file(
 ) -> None:
     """Write FFmpeg concat demuxer file from lip-sync bools."""
     runs = _run_length_encode(lipsync)
+    # Stringify both paths once instead of per run
+    entries = {True: f"file '{talking_png}'", False: f"file '{idle_png}'"}
     lines = ["ffconcat version 1.0"]
 
     for is_talking, count in runs:
-        png = talking_png if is_talking else idle_png
-        duration = count / FPS
-        lines.append(f"file '{png}'")
-        lines.append(f"duration {duration:.6f}")
+        lines.append(entries[is_talking])
+        lines.append(f"duration {count / FPS:.6f}")
 
     # Concat demuxer needs the last file repeated without duration
     last_talking = runs[-1][0] if runs else False
-    last_png = talking_png if last_talking else idle_png
-    lines.append(f"file '{last_png}'")
+    lines.append(entries[last_talking])
 
     path.write_text("\n".join(lines))
 
@@ -276,7 +278,7 @@ def concatenate_segments(
     else:
         _concatenate_copy(segment_paths, output, temp_dir)
 
-    print(f"[compositor] Final output: {output}")
+    log.info(f"Final output: {output}")
 
 
 def _concatenate_copy(
@@ -289,10 +291,7 @@ def _concatenate_copy(
         import tempfile as _tf
         concat_file = Path(_tf.mktemp(suffix="_concat.txt"))
 
-    lines = []
-    for p in segment_paths:
-        lines.append(f"file '{p}'")
-    concat_file.write_text("\n".join(lines))
+    concat_file.write_text("\n".join(f"file '{p}'" for p in segment_paths))
 
     run_ffmpeg([
         "-f", "concat", "-safe", "0", "-i", str(concat_file),
@@ -12,6 +12,7 @@ PIXEL_FMT = "yuv420p"
 # Audio
 AUDIO_SAMPLE_RATE = 44100
 AUDIO_CHANNELS = 2
+TTS_LINE_WORKERS = 3  # dialog lines synthesized concurrently
 
 # Codec — overridden at runtime by detect_encoder()
 DEFAULT_ENCODER = "libx264"
@@ -11,6 +11,7 @@ Phase 2 rules:
 - Character emotion states tracked per segment
 """
 
+import logging
 import random
 
 from visual.config import (
@@ -30,6 +31,8 @@ from visual.config import (
 )
 from visual.models import Script, DialogLine, EDL, EDLSegment
 
+log = logging.getLogger("hermes.director")
+
 
 def _closeup_shot_type(character: str, characters: list[str]) -> str:
     """Determine closeup shot type based on character position."""
@@ -232,6 +235,6 @@ def generate_edl(script: Script) -> EDL:
 
             prev_line = line
 
-    print(f"[director] Generated EDL: {len(edl.segments)} segments, "
+    log.info(f"Generated EDL: {len(edl.segments)} segments, "
           f"{edl.total_duration_ms}ms total")
     return edl
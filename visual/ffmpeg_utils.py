@@ -1,16 +1,19 @@
 """FFmpeg helper functions — run commands, probe durations, detect HW encoder."""
 
 import json
+import logging
 import subprocess
 from pathlib import Path
 
 from visual.config import DEFAULT_ENCODER, WIDTH, HEIGHT, FPS, PIXEL_FMT
 
+log = logging.getLogger("hermes.ffmpeg")
+
 
 def run_ffmpeg(args: list[str], desc: str = "") -> None:
     """Run an FFmpeg command, raising on failure."""
     cmd = ["ffmpeg", "-y", "-hide_banner", "-loglevel", "warning"] + args
-    print(f"[ffmpeg] {desc or ' '.join(cmd[:8])}")
+    log.info(f"{desc or ' '.join(cmd[:8])}")
     result = subprocess.run(cmd, capture_output=True, text=True)
     if result.returncode != 0:
         raise RuntimeError(f"FFmpeg failed ({desc}): {result.stderr[-500:]}")
@@ -47,12 +50,12 @@ def detect_encoder() -> str:
         ]
         result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
         if result.returncode == 0:
-            print("[ffmpeg] Using HW encoder: h264_v4l2m2m")
+            log.info("Using HW encoder: h264_v4l2m2m")
             return "h264_v4l2m2m"
     except (subprocess.TimeoutExpired, Exception):
         pass
 
-    print(f"[ffmpeg] Using software encoder: {DEFAULT_ENCODER}")
+    log.info(f"Using software encoder: {DEFAULT_ENCODER}")
     return DEFAULT_ENCODER
 
 
@@ -1,11 +1,14 @@
 """Standalone TTS wrapper — synchronous interface over core TTS providers."""
 
 import asyncio
+import logging
 import os
 import uuid
 
 from visual.ffmpeg_utils import probe_duration_ms
 
+log = logging.getLogger("hermes.tts")
+
 
 def synthesize_line(
     text: str,
@@ -43,7 +46,7 @@ def synthesize_line(
         raise RuntimeError(f"TTS failed for: {text[:50]}")
 
     duration = probe_duration_ms(audio_path)
-    print(f"[tts] {character}: {duration}ms — {text[:40]}...")
+    log.info(f"{character}: {duration}ms — {text[:40]}...")
     return audio_path, duration
 
 